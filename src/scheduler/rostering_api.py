@@ -1,12 +1,23 @@
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any, Tuple
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Dict, Iterable, Optional, Any, NamedTuple, Tuple
 from ortools.sat.python import cp_model
-from datetime import time, datetime, timedelta
+from datetime import time
 from enum import Enum
+from functools import lru_cache
+from itertools import compress
 import logging
+import os
+import threading
 
-api = FastAPI(title="Car Yard Rostering API", version="1.0.0")
+api = FastAPI(title="Car Yard Rostering API", version="1.0.0",
+              default_response_class=ORJSONResponse)
+
+# Upper bound on a request's time_limit_seconds. Solves share a small number of
+# slots per process, so a longer budget would hold up every other request
+MAX_SOLVER_TIMEOUT_SECONDS = 60.0
 
 
 class DayOfWeek(str, Enum):
@@ -37,6 +48,8 @@ class CarYardRegion(str, Enum):
 
 
 class Employee(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     ranking: EmployeeReliabilityRating
@@ -45,6 +58,8 @@ class Employee(BaseModel):
 
 
 class CarYard(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     startTime: Optional[time] = None
@@ -64,6 +79,8 @@ class CarYard(BaseModel):
 
 
 class ScheduleRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     employees: List[Employee]
     car_yards: List[CarYard]
     days: List[DayOfWeek]
@@ -81,9 +98,53 @@ class ScheduleRequest(BaseModel):
         ge=0,
         description="Minimum buffer between consecutive yards for the same day (travel time)."
     )
+    num_search_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Parallel CP-SAT search workers, capped at 16. Defaults to the available cores; " +
+        "workers beyond the first few run LNS. Ties between equally good rosters may resolve " +
+        "differently for different worker counts; use 1 for reproducible results."
+    )
+    linearization_level: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=2,
+        description="CP-SAT LP linearization level (0 = pure SAT search, 2 = full cuts). " +
+        "Defaults to 2 for small models and 1 for large ones."
+    )
+    optimize_with_core: Optional[bool] = Field(
+        default=None,
+        description="Use CP-SAT's core-based optimization, which can help weighted-sum objectives."
+    )
+    cp_model_presolve: Optional[bool] = Field(
+        default=None,
+        description="Run CP-SAT presolve before search (CP-SAT default: enabled)."
+    )
+    time_limit_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        le=MAX_SOLVER_TIMEOUT_SECONDS,
+        description="Total solver time budget, shared between the priority and secondary stages. " +
+        f"Defaults to 10 seconds (5 for previews), at most {MAX_SOLVER_TIMEOUT_SECONDS:g}; " +
+        "the best roster found in time is returned."
+    )
+    preview: bool = Field(
+        default=False,
+        description="Return the first feasible roster found instead of optimising it. " +
+        "Much faster, intended for interactive what-if edits; the roster may be far from optimal."
+    )
+    solver_params: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="CP-SAT search parameter overrides applied to both solve stages, keyed " +
+        "by SatParameters field name (e.g. {\"random_seed\": 7}). Only search-tuning " +
+        "parameters are accepted; the time limit, worker count and logging cannot be " +
+        "overridden. Applied after the dedicated tuning fields."
+    )
 
 
 class Assignment(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     employee_id: int
     employee_name: str
     car_yard_id: int
@@ -94,6 +155,8 @@ class Assignment(BaseModel):
 
 
 class YardSchedule(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     car_yard_id: int
     car_yard_name: str
     workers: List[str]
@@ -102,45 +165,155 @@ class YardSchedule(BaseModel):
 
 
 class DayRoster(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     day: DayOfWeek
     yards: List[YardSchedule]
 
 
 class RosterStructure(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     days: List[DayRoster]
 
 
+class YardTimeblock(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    car_yard_id: int
+    car_yard_name: str
+    day: str
+    start_time: str
+    finish_time: str
+    employees: List[int]
+    minutes_per_employee: float
+    per_employee_hours: float
+
+
+class ScheduleStats(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    total_assignments: int
+    shifts_per_employee: Dict[int, int]
+    yards_covered: Dict[str, int]
+    hours_per_employee_day: Dict[str, float]
+    yard_timeblocks: List[YardTimeblock]
+    solve_time_seconds: float
+
+
 class ScheduleResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     status: str
     assignments: List[Assignment]
     roster: RosterStructure
-    stats: Dict[str, Any]
+    stats: ScheduleStats
 
 
 # Objective function weights (constants)
-OBJECTIVE_PRIORITY_WEIGHT = 10000
-OBJECTIVE_QUALITY_WEIGHT = 10
-OBJECTIVE_GROUPING_WEIGHT = 10
-OBJECTIVE_BALANCE_WEIGHT = 50
-OBJECTIVE_EXTRA_EMPLOYEE_WEIGHT = 2000
-OBJECTIVE_PARTIAL_OVERLAP_WEIGHT = 2000
-OBJECTIVE_ASSIGNMENT_PENALTY = 10
+# Priority coverage is optimised in its own solve stage first, so these weights
+# only trade off the secondary objectives against each other. They are kept at
+# their smallest integer ratios to keep objective coefficients small
+OBJECTIVE_QUALITY_WEIGHT = 1
+OBJECTIVE_GROUPING_WEIGHT = 1
+OBJECTIVE_BALANCE_WEIGHT = 5
+OBJECTIVE_EXTRA_EMPLOYEE_WEIGHT = 200
+OBJECTIVE_PARTIAL_OVERLAP_WEIGHT = 200
+OBJECTIVE_ASSIGNMENT_PENALTY = 1
 
 # Priority weights for yard coverage
-PRIORITY_WEIGHT_HIGH = 1000
-PRIORITY_WEIGHT_MEDIUM = 100
-PRIORITY_WEIGHT_LOW = 10
+PRIORITY_WEIGHT_HIGH = 100
+PRIORITY_WEIGHT_MEDIUM = 10
+PRIORITY_WEIGHT_LOW = 1
 
 # Grouping bonus base weight
 GROUPING_BONUS_BASE_WEIGHT = 50
 
 # Solver configuration
 DEFAULT_SOLVER_TIMEOUT_SECONDS = 10.0
+# Share of the time budget given to the priority-coverage stage; the secondary
+# stage gets the remainder
+PRIORITY_STAGE_TIME_FRACTION = 0.5
+# Time limit for preview requests, which stop at the first feasible roster
+PREVIEW_SOLVER_TIMEOUT_SECONDS = 5.0
+# Shortest time limit given to a solve stage, so a fallback solve still gets
+# a chance to run when an earlier attempt used up the budget
+MIN_STAGE_TIME_SECONDS = 0.5
+# CP-SAT is tuned for 8-16 workers: the first few run the generic portfolio
+# strategies and the remainder run LNS, so use every core up to that cap
+DEFAULT_SOLVER_NUM_WORKERS = 8
+MAX_SOLVER_NUM_WORKERS = 16
+# Number of uvicorn worker processes sharing the machine; each solve only takes
+# its share of the cores so parallel requests don't oversubscribe the CPU
+API_WORKERS = max(1, int(os.environ.get("ROSTER_API_WORKERS", "1")))
+# Number of solves each process runs at once (CP-SAT releases the GIL, so solves
+# on the thread pool run in parallel); each gets an equal share of the process's
+# cores, and further requests wait for a free slot instead of oversubscribing.
+# By default every slot keeps the default worker count
+CONCURRENT_SOLVES = max(1, int(os.environ.get(
+    "ROSTER_CONCURRENT_SOLVES",
+    (os.cpu_count() or DEFAULT_SOLVER_NUM_WORKERS)
+    // (API_WORKERS * DEFAULT_SOLVER_NUM_WORKERS))))
+_solve_slots = threading.BoundedSemaphore(CONCURRENT_SOLVES)
+# Set ROSTER_SOLVER_LOG=1 to send the CP-SAT search log (presolve and search
+# timings per worker) to this module's logger; off in production by default
+SOLVER_LOG_ENABLED = os.environ.get("ROSTER_SOLVER_LOG", "0") == "1"
+
+# Number of distinct requests whose responses are kept for repeat queries
+ROSTER_CACHE_SIZE = 128
+
+# Number of built models kept for requests that only differ in solver settings
+MODEL_CACHE_SIZE = 32
+# Request fields that map one-to-one onto CP-SAT parameters of the same name
+SOLVER_TUNING_FIELDS = ("linearization_level",
+                        "optimize_with_core", "cp_model_presolve")
+# Request fields that only tune the solver and don't change the model
+SOLVER_ONLY_FIELDS = {"num_search_workers", "time_limit_seconds", "preview",
+                      "solver_params", *SOLVER_TUNING_FIELDS}
+# CP-SAT parameters callers may override through solver_params. Only search
+# tuning is exposed: the time budget, worker count and logging stay under the
+# service's control so one request can't starve the others or flood the logs.
+# Integer parameters map to their accepted (min, max) range; parameters with a
+# dedicated request field must be set through that (validated) field instead
+SOLVER_PARAM_RANGES: Dict[str, Tuple[int, int]] = {
+    "symmetry_level": (0, 4),
+    "cp_model_probing_level": (0, 2),
+    "core_minimization_level": (0, 2),
+    "random_seed": (0, 2**31 - 1),
+}
+SOLVER_BOOL_PARAMS = frozenset({
+    "randomize_search",
+    "stop_after_first_solution",
+    "repair_hint",
+    "use_optimization_hints",
+    "use_objective_lb_search",
+    "use_objective_shaving_search",
+    "use_lns_only",
+})
+# Enum parameters, whose values CP-SAT validates itself
+SOLVER_ENUM_PARAMS = frozenset({"search_branching"})
+ALLOWED_SOLVER_PARAMS = frozenset(
+    {*SOLVER_PARAM_RANGES, *SOLVER_BOOL_PARAMS, *SOLVER_ENUM_PARAMS})
+
+# Models with at most this many assignment variables are solved on a single
+# worker: they solve instantly and the parallel portfolio only adds startup cost
+SMALL_MODEL_MAX_ASSIGNMENTS = 50
+
+# Solver tuning profile. Level 2 linearization adds cuts that tighten the LP
+# relaxation, which pays off on small models but slows propagation on large ones
+LINEARIZATION_MAX_YARD_DAYS = 500
+# Full probing (level 2) spends presolve time on the many reified Booleans for
+# little gain here; level 1 keeps the cheap probing passes. Core-based
+# optimization is left off: it stalls on the weighted secondary objective
+SOLVER_PROBING_LEVEL = 1
 
 # Time constants
 DEFAULT_EARLIEST_START_HOUR = 6
 DEFAULT_EARLIEST_START_MINUTE = 0
 MINUTES_PER_HOUR = 60
+MINUTES_PER_DAY = 24 * MINUTES_PER_HOUR
+MICROSECONDS_PER_MINUTE = 60 * 1_000_000
+SCALE_FACTOR = MINUTES_PER_HOUR  # Convert hours to minutes for integer arithmetic
 
 # Floating point tolerance
 FLOATING_POINT_TOLERANCE = 1e-6
@@ -148,14 +321,55 @@ FLOATING_POINT_TOLERANCE = 1e-6
 # Default priority rank for sorting (used when priority not found)
 DEFAULT_PRIORITY_RANK = 3
 
+# One bit per weekday, so an employee's availability packs into a single int
+DAY_BIT = {day: 1 << idx for idx, day in enumerate(DayOfWeek)}
+
+# Sort order for yard priorities (lower rank first)
+PRIORITY_RANK = {
+    CarYardPriority.HIGH: 0,
+    CarYardPriority.MEDIUM: 1,
+    CarYardPriority.LOW: 2,
+}
+
+
+class _RosterModel(NamedTuple):
+    """A built roster model plus the lookups needed to solve it and read results"""
+    model: cp_model.CpModel
+    employees: Dict[int, Employee]
+    car_yards: Dict[int, CarYard]
+    days: List[DayOfWeek]
+    emp_names: Dict[int, str]
+    yard_minutes: Dict[int, int]
+    x: Dict[Tuple[int, int, DayOfWeek], cp_model.IntVar]
+    covered: Dict[Tuple[int, DayOfWeek], cp_model.IntVar]
+    work_minutes: Dict[Tuple[int, int, DayOfWeek], cp_model.IntVar]
+    fixed_crew_load: Dict[int, int]
+    priority_objective: cp_model.LinearExpr
+    hint_priority: int
+    secondary_objective: cp_model.LinearExpr
+
+
+def _add_reified_or(
+    model: cp_model.CpModel,
+    any_var: cp_model.IntVar,
+    literals: List[Any]
+) -> None:
+    """
+    Constrain any_var to be 1 exactly when at least one of the literals is 1.
+
+    Uses CP-SAT's max constraint rather than one linear bound per literal. An
+    empty max is infeasible, so with no literals any_var is pinned to 0.
+    """
+    model.AddMaxEquality(any_var, literals or [0])
+
 
 def _create_partial_overlap_penalty(
     model: cp_model.CpModel,
-    employees: Dict[int, Employee],
     cy_a: int,
     cy_b: int,
     day: DayOfWeek,
-    x: Dict[Tuple[int, int, DayOfWeek], cp_model.IntVar]
+    column_a: List[Any],
+    column_b: List[Any]
 ) -> cp_model.IntVar:
     """
     Create penalty variable for partial crew overlap between two yards on the same day.
@@ -166,81 +380,247 @@ def _create_partial_overlap_penalty(
 
     Args:
         model: The CP-SAT model
-        employees: Dictionary of employees by ID
         cy_a: First car yard ID
         cy_b: Second car yard ID
         day: Day of week
-        x: Decision variables x[(emp_id, cy_id, day)]
+        column_a: Each employee's assignment variable for yard A on this day,
+            or 0 where the assignment is impossible
+        column_b: The same for yard B
 
     Returns:
-        A boolean variable that is 1 if partial overlap occurs (penalty case)
+        A boolean variable that is 1 if partial overlap occurs (penalty case). It is
+        only bounded from below, so it must be minimised to take its exact value
     """
-    shared_vars = []
-    joiner_vars = []
-
-    for emp_id in employees.keys():
-        # shared_var = 1 if employee works both yards
-        shared_var = model.NewBoolVar(
-            f'shared_e{emp_id}_cy{cy_a}_{cy_b}_{day}')
-        model.Add(shared_var <= x[(emp_id, cy_a, day)])
-        model.Add(shared_var <= x[(emp_id, cy_b, day)])
-        model.Add(shared_var >= x[(emp_id, cy_a, day)] +
-                  x[(emp_id, cy_b, day)] - 1)
-        shared_vars.append(shared_var)
-
-        # joiner_var = 1 if employee works yard B but not yard A (joins mid-day)
-        joiner_var = model.NewBoolVar(
-            f'joiner_e{emp_id}_cy{cy_a}_{cy_b}_{day}')
-        model.Add(joiner_var <= x[(emp_id, cy_b, day)])
-        model.Add(joiner_var + x[(emp_id, cy_a, day)] <= 1)
-        model.Add(joiner_var >= x[(emp_id, cy_b, day)] -
-                  x[(emp_id, cy_a, day)])
-        joiner_vars.append(joiner_var)
-
-    # share_any = 1 if any employee works both yards
+    # The penalty is only ever minimised, so every indicator needs just its
+    # lower bound: the solver drives it to 0 whenever the roster allows. That
+    # lets both indicators bound the assignment literals directly, without a
+    # shared/joiner variable per employee.
     share_any = model.NewBoolVar(
         f'share_any_cy{cy_a}_{cy_b}_{day}')
-    for shared_var in shared_vars:
-        model.Add(shared_var <= share_any)
-    model.Add(share_any <= sum(shared_vars))
-
-    # joiner_any = 1 if any employee joins mid-day (works B but not A)
     joiner_any = model.NewBoolVar(
         f'joiner_any_cy{cy_a}_{cy_b}_{day}')
-    for joiner_var in joiner_vars:
-        model.Add(joiner_var <= joiner_any)
-    model.Add(joiner_any <= sum(joiner_vars))
+    for x_a, x_b in zip(column_a, column_b):
+        if isinstance(x_b, int):
+            # Employee can never work yard B, so they can neither share nor join
+            continue
+        if isinstance(x_a, int):
+            # Employee can never work yard A, so working yard B always means joining
+            model.Add(joiner_any >= x_b)
+            continue
+        # share_any = 1 if any employee works both yards
+        model.Add(share_any >= x_a + x_b - 1)
+        # joiner_any = 1 if any employee works yard B but not yard A (joins mid-day)
+        model.Add(joiner_any >= x_b - x_a)
 
     # mix_var = 1 if both share_any and joiner_any are true (partial overlap penalty)
     mix_var = model.NewBoolVar(
         f'mix_penalty_cy{cy_a}_{cy_b}_{day}')
     model.Add(mix_var >= share_any + joiner_any - 1)
-    model.Add(mix_var <= share_any)
-    model.Add(mix_var <= joiner_any)
 
     return mix_var
 
 
-def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
+def _add_lex_greater_or_equal(
+    model: cp_model.CpModel,
+    row_a: List[cp_model.IntVar],
+    row_b: List[cp_model.IntVar],
+    name: str
+) -> None:
     """
-    Solve the rostering problem using OR-Tools CP-SAT solver
+    Constrain boolean vector row_a to be lexicographically >= row_b.
 
-    Constraints:
-    - Each yard must have min-max employees if covered
-    - Yards respect required days, visit counts, spacing rules, and linked-yard gaps
-    - Employees can work multiple yards per day, limited by max_hours_per_day
-    - Employees can only work on available days and avoid excluded regions
-    - Grouping bonus encourages yards in the same group to be done together
+    prefix_equal tracks whether the rows agree on every position so far; while
+    they do, row_a must be at least row_b at the next position.
 
-    Objectives (in priority order):
-    1. Cover high-priority yards first
-    2. Use higher reliability-rated employees
-    3. Encourage grouping (yards in same group done together)
-    4. Balance workload across employees
+    Args:
+        model: The CP-SAT model
+        row_a: Boolean variables of the first row
+        row_b: Boolean variables of the second row, aligned with row_a
+        name: Prefix for the auxiliary variable names
     """
-    # Initialize logger once
-    logger = logging.getLogger(__name__)
+    prefix_equal = None
+    for k, (a, b) in enumerate(zip(row_a, row_b)):
+        if prefix_equal is None:
+            model.Add(a >= b)
+        else:
+            model.Add(a >= b).OnlyEnforceIf(prefix_equal)
+        if k == len(row_a) - 1:
+            break
+
+        # still_equal <=> prefix_equal and a == b
+        still_equal = model.NewBoolVar(f'{name}_eq{k}')
+        model.Add(a == b).OnlyEnforceIf(still_equal)
+        prefix_broken = []
+        if prefix_equal is not None:
+            model.AddImplication(still_equal, prefix_equal)
+            prefix_broken = [prefix_equal.Not()]
+        model.AddBoolOr([still_equal, a.Not(), b.Not()] + prefix_broken)
+        model.AddBoolOr([still_equal, a, b] + prefix_broken)
+        prefix_equal = still_equal
+
+
+def _time_to_minutes(value: time) -> float:
+    """Minutes since midnight, keeping any seconds as a fraction"""
+    return (value.hour * MINUTES_PER_HOUR + value.minute
+            + (value.second + value.microsecond / 1e6) / 60)
+
+
+def _minutes_to_iso(minutes: float) -> str:
+    """HH:MM for minutes since midnight (wrapping past midnight like time)"""
+    # Rounded to whole microseconds first, as timedelta arithmetic would
+    microseconds = round(minutes * MICROSECONDS_PER_MINUTE)
+    whole = microseconds // MICROSECONDS_PER_MINUTE % MINUTES_PER_DAY
+    return f"{whole // MINUTES_PER_HOUR:02d}:{whole % MINUTES_PER_HOUR:02d}"
+
+
+def _availability_mask(emp: Employee) -> int:
+    """Bitmask of the employee's available days (see DAY_BIT)"""
+    mask = 0
+    for day in emp.available_days:
+        mask |= DAY_BIT[day]
+    return mask
+
+
+def _assignment_candidates(
+    employees: Dict[int, Employee],
+    car_yards: Dict[int, CarYard],
+    days: List[DayOfWeek],
+    avail_mask: Dict[int, int]
+) -> List[Tuple[int, int, DayOfWeek]]:
+    """
+    List the (emp_id, cy_id, day) triples that can ever be assigned.
+
+    Pure index computation with no solver calls, so model building only has to
+    create one variable per returned triple. A triple is excluded when the employee
+    is unavailable that day, is excluded from the yard's region, or the yard may
+    not be visited that day (required_days without per_week).
+
+    Args:
+        employees: Dictionary of employees by ID
+        car_yards: Dictionary of car yards by ID
+        days: Days being scheduled, in order
+        avail_mask: Availability bitmask per employee (see DAY_BIT)
+
+    Returns:
+        Assignable triples in employee, yard, day order
+    """
+    yard_day_mask = {
+        cy_id: sum(DAY_BIT[day] for day in set(cy.required_days))
+        if cy.required_days and not cy.per_week else ~0
+        for cy_id, cy in car_yards.items()
+    }
+    yards_by_region: Dict[CarYardRegion, List[int]] = {}
+    for cy_id, cy in car_yards.items():
+        yards_by_region.setdefault(cy.region, []).append(cy_id)
+
+    # Employees and yards share only a handful of distinct day masks, so each
+    # combined mask is decoded into its list of days once
+    days_for_mask: Dict[int, List[DayOfWeek]] = {}
+    cy_ids = tuple(car_yards)
+    candidates = []
+    for emp_id, emp in employees.items():
+        excluded = set(yards_by_region.get(emp.not_region, ()))
+        for cy_id in cy_ids:
+            if cy_id in excluded:
+                continue
+            allowed_mask = avail_mask[emp_id] & yard_day_mask[cy_id]
+            allowed_days = days_for_mask.get(allowed_mask)
+            if allowed_days is None:
+                allowed_days = [day for day in days if allowed_mask & DAY_BIT[day]]
+                days_for_mask[allowed_mask] = allowed_days
+            candidates.extend((emp_id, cy_id, day) for day in allowed_days)
+    return candidates
+
+
+def _greedy_hint(
+    employees: Dict[int, Employee],
+    car_yards: Dict[int, CarYard],
+    days: List[DayOfWeek],
+    max_minutes: int,
+    coverage_requirements: Dict[int, Tuple[int, int]]
+) -> Tuple[Dict[Tuple[int, int, DayOfWeek], int], Dict[Tuple[int, DayOfWeek], int]]:
+    """
+    Build a quick greedy roster to warm-start the solver.
+
+    Yards are visited in priority order (longest first within a priority); each
+    takes its required number of days (respecting the per-week gap) and is
+    staffed with min_employees of the highest ranked employees who are available,
+    allowed in the region and still have enough hours left that day. Linked-yard
+    gaps are not checked, so the result is only a hint and the solver repairs
+    anything it violates.
+
+    Args:
+        employees: Dictionary of employees by ID
+        car_yards: Dictionary of car yards by ID
+        days: Days being scheduled, in order
+        max_minutes: Maximum work minutes per employee per day
+        coverage_requirements: (visits required, minimum gap in days) per yard
 
+    Returns:
+        Tuple of (assignments, covered): assignments maps (emp_id, cy_id, day) to 1
+        for every greedy assignment and covered maps (cy_id, day) to 1 for every
+        staffed yard-day
+    """
+    hint: Dict[Tuple[int, int, DayOfWeek], int] = {}
+    covered_hint: Dict[Tuple[int, DayOfWeek], int] = {}
+    avail_mask = {emp_id: _availability_mask(emp)
+                  for emp_id, emp in employees.items()}
+    minutes_used = {(emp_id, day): 0 for emp_id in employees for day in days}
+    ranked_employees = sorted(
+        employees.values(), key=lambda emp: (-emp.ranking.value, emp.id))
+    # Within a priority the longest jobs go first, while the most employees
+    # still have hours left
+    yards_by_priority = sorted(
+        car_yards.values(),
+        key=lambda cy: (PRIORITY_RANK.get(cy.priority, DEFAULT_PRIORITY_RANK),
+                        -cy.hours_required, cy.id))
+
+    for cy in yards_by_priority:
+        visits_required, min_gap = coverage_requirements[cy.id]
+        # Candidate days are kept as positions in days so the gap check is
+        # plain integer arithmetic
+        required_days = frozenset(cy.required_days or ())
+        if required_days and not cy.per_week:
+            candidate_days = [k for k, day in enumerate(days)
+                              if day in required_days]
+        elif required_days:
+            # At least one visit must land on a required day, so try those first
+            candidate_days = sorted(
+                range(len(days)), key=lambda k: days[k] not in required_days)
+        else:
+            candidate_days = list(range(len(days)))
+
+        share = -(-int(cy.hours_required * MINUTES_PER_HOUR) // cy.min_employees)
+        visited: List[int] = []
+        for day_idx in candidate_days:
+            if len(visited) >= visits_required:
+                break
+            day = days[day_idx]
+            if any(abs(day_idx - other) < min_gap for other in visited):
+                continue
+            crew = [
+                emp for emp in ranked_employees
+                if avail_mask[emp.id] & DAY_BIT[day]
+                and emp.not_region != cy.region
+                and minutes_used[(emp.id, day)] + share <= max_minutes
+            ][:cy.min_employees]
+            if len(crew) < cy.min_employees:
+                continue
+            for emp in crew:
+                minutes_used[(emp.id, day)] += share
+                hint[(emp.id, cy.id, day)] = 1
+            covered_hint[(cy.id, day)] = 1
+            visited.append(day_idx)
+
+    return hint, covered_hint
+
+
+def _build_roster_model(request: ScheduleRequest) -> _RosterModel:
+    """
+    Validate the request and build the CP-SAT model with all constraints, both
+    objective stages and the greedy warm-start hints. See solve_roster for the
+    constraints and objectives.
+    """
     # Input validation
     if len(request.employees) != len({emp.id for emp in request.employees}):
         raise HTTPException(
@@ -248,11 +628,21 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
             detail="Duplicate employee IDs found. Each employee must have a unique ID."
         )
 
-    if len(request.car_yards) != len({cy.id for cy in request.car_yards}):
-        raise HTTPException(
-            status_code=400,
-            detail="Duplicate car yard IDs found. Each car yard must have a unique ID."
-        )
+    # Validate car yards in a single pass (unique IDs, min <= max) while
+    # indexing them by ID
+    car_yards: Dict[int, CarYard] = {}
+    for cy in request.car_yards:
+        if cy.id in car_yards:
+            raise HTTPException(
+                status_code=400,
+                detail="Duplicate car yard IDs found. Each car yard must have a unique ID."
+            )
+        if cy.min_employees > cy.max_employees:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Car yard {cy.id} ({cy.name}) has min_employees ({cy.min_employees}) > max_employees ({cy.max_employees})."
+            )
+        car_yards[cy.id] = cy
 
     if not request.employees:
         raise HTTPException(
@@ -272,70 +662,113 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
             detail="At least one day is required."
         )
 
-    # Validate min <= max for each yard
-    for cy in request.car_yards:
-        if cy.min_employees > cy.max_employees:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Car yard {cy.id} ({cy.name}) has min_employees ({cy.min_employees}) > max_employees ({cy.max_employees})."
-            )
-
     # Validate yard_groups
     if request.yard_groups:
-        all_yard_ids = {cy.id for cy in request.car_yards}
         for group_name, cy_ids in request.yard_groups.items():
             invalid_ids = [
-                cy_id for cy_id in cy_ids if cy_id not in all_yard_ids]
+                cy_id for cy_id in cy_ids if cy_id not in car_yards]
             if invalid_ids:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Yard group '{group_name}' contains invalid yard IDs: {invalid_ids}. Valid yard IDs are: {sorted(all_yard_ids)}."
+                    detail=f"Yard group '{group_name}' contains invalid yard IDs: {invalid_ids}. Valid yard IDs are: {sorted(car_yards)}."
                 )
 
     model = cp_model.CpModel()
 
     # Create indices
     employees = {emp.id: emp for emp in request.employees}
-    car_yards = {cy.id: cy for cy in request.car_yards}
     days = request.days
 
+    # Derived per-entity values, computed once instead of re-reading model
+    # attributes inside the loops below
+    emp_names = {emp_id: emp.name for emp_id, emp in employees.items()}
+    yard_minutes = {cy_id: int(cy.hours_required * MINUTES_PER_HOUR)
+                    for cy_id, cy in car_yards.items()}
+    yard_required_days = {cy_id: frozenset(cy.required_days or ())
+                          for cy_id, cy in car_yards.items()}
+
     # Decision variables: x[e][cy][d] = 1 if employee e works at car_yard cy on day d
-    x = {}
-    for emp_id in employees.keys():
-        for cy_id in car_yards.keys():
-            for day in days:
-                x[(emp_id, cy_id, day)] = model.NewBoolVar(
-                    f'x_e{emp_id}_cy{cy_id}_{day}')
+    # Variables are only created where the assignment is possible: the employee is
+    # available, not excluded from the yard's region, and the yard may be visited
+    # that day (required_days without per_week restricts it to those days). A
+    # missing key means the assignment is fixed to 0, so lookups use x.get(key, 0)
+    avail_mask = {emp_id: _availability_mask(emp)
+                  for emp_id, emp in employees.items()}
+    # x_grid is the dense positional view of x for the hot sums below:
+    # x_grid[i][j][k] is the variable for the i-th employee, j-th yard and k-th
+    # day (0 where x has no key). It is filled as the variables are created
+    emp_ids = tuple(employees)
+    cy_ids = tuple(car_yards)
+    emp_index = {emp_id: i for i, emp_id in enumerate(emp_ids)}
+    cy_index = {cy_id: j for j, cy_id in enumerate(cy_ids)}
+    day_index = {day: k for k, day in enumerate(days)}
+    x_grid = [[[0] * len(days) for _ in cy_ids] for _ in emp_ids]
+    x: Dict[Tuple[int, int, DayOfWeek], cp_model.IntVar] = {}
+    for emp_id, cy_id, day in _assignment_candidates(
+            employees, car_yards, days, avail_mask):
+        var = model.NewBoolVar(f'x_e{emp_id}_cy{cy_id}_{day}')
+        x[(emp_id, cy_id, day)] = var
+        x_grid[emp_index[emp_id]][cy_index[cy_id]][day_index[day]] = var
+
+    # Fail fast instead of solving a model where nobody can ever be assigned
+    if not x:
+        raise HTTPException(
+            status_code=400,
+            detail="No feasible assignments produced. Check availability, required days, or coverage limits."
+        )
+
+    # Eligible employees per yard-day, used to reject impossible visit requirements
+    eligible_count: Dict[Tuple[int, DayOfWeek], int] = {}
+    for _, cy_id, day in x.keys():
+        eligible_count[(cy_id, day)] = eligible_count.get((cy_id, day), 0) + 1
+
+    # Each employee's shift count, built once as a flat LinearExpr.Sum (rather than
+    # chained __add__) and reused by the quality and workload balance objectives
+    shift_totals = [cp_model.LinearExpr.Sum([var for yard_row in emp_row for var in yard_row
+                                             if not isinstance(var, int)])
+                    for emp_row in x_grid]
+
+    # Symmetry breaking: employees with the same ranking, availability and region
+    # exclusion are interchangeable in every constraint and objective term, so
+    # order the assignment rows of each such class lexicographically to prune
+    # permuted copies of a roster. Members share the same variable layout, so
+    # only positions with a variable take part.
+    interchangeable: Dict[Tuple[Any, ...], List[int]] = {}
+    for i, emp_id in enumerate(emp_ids):
+        emp = employees[emp_id]
+        signature = (emp.ranking, avail_mask[emp_id], emp.not_region)
+        interchangeable.setdefault(signature, []).append(i)
+    for members in interchangeable.values():
+        rows = [[var for yard_row in x_grid[i] for var in yard_row
+                 if not isinstance(var, int)] for i in members]
+        for (a, row_a), row_b in zip(zip(members, rows), rows[1:]):
+            _add_lex_greater_or_equal(
+                model, row_a, row_b, f'lex_e{emp_ids[a]}')
 
     # NEW: Decision variable for whether a yard is covered on a day
     # covered[cy][d] = 1 if car_yard cy is covered (has at least min_employees) on day d
     covered = {}
-    for cy_id in car_yards.keys():
+    for cy_id in cy_ids:
         for day in days:
             covered[(cy_id, day)] = model.NewBoolVar(
                 f'covered_cy{cy_id}_{day}')
 
-    day_index = {day: idx for idx, day in enumerate(days)}
     coverage_requirements: Dict[int, Tuple[int, int]] = {}
     link_pairs: Dict[Tuple[int, int], int] = {}
 
-    # Restrict assignments to allowed days and collect visit requirements
-    # When required_days is set WITHOUT per_week: restrict to only required days (current behavior)
-    # When required_days is set WITH per_week: allow all days, but ensure at least one visit on required day
+    scheduled_days = frozenset(days)
+
+    # Pin coverage off on yard-days that can never be staffed and collect visit requirements
     for cy_id, cy in car_yards.items():
-        has_per_week = bool(cy.per_week)
         has_required_days = bool(cy.required_days)
 
-        # If required_days is set but per_week is NOT set: restrict to only required days
-        if has_required_days and not has_per_week:
-            allowed_days = set(cy.required_days)
-            for day in days:
-                if day not in allowed_days:
-                    model.Add(covered[(cy_id, day)] == 0)
-                    for emp_id in employees.keys():
-                        model.Add(x[(emp_id, cy_id, day)] == 0)
-        # If required_days is set WITH per_week: allow all days (no restriction here)
-        # We'll add a constraint later to ensure at least one visit on a required day
+        # Pin covered == 0 on every day with fewer eligible employees than the
+        # minimum crew. This includes the days outside required_days of a yard
+        # without per_week, which never got assignment variables, so only the
+        # coverage literal needs pinning.
+        for day in days:
+            if eligible_count.get((cy_id, day), 0) < cy.min_employees:
+                model.Add(covered[(cy_id, day)] == 0)
 
         if cy.per_week:
             visits_required, min_gap = cy.per_week
@@ -348,14 +781,13 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
             # If required_days is also set, validate that at least one visit can occur on a required day
             # This means we need enough days between required days and other days to satisfy gap
             if has_required_days:
-                required_days_set = set(cy.required_days)
+                required_days_set = yard_required_days[cy_id]
                 # Check if there are enough days available after considering the gap constraint
                 # For example, if per_week=(2, 2) and required_days=[MONDAY], we need:
                 # - At least one day that's Monday (required)
                 # - At least one day that's at least gap days away from Monday
-                available_days_set = set(days)
-                if not required_days_set.issubset(available_days_set):
-                    missing_days = required_days_set - available_days_set
+                if not required_days_set <= scheduled_days:
+                    missing_days = required_days_set - scheduled_days
                     raise HTTPException(
                         status_code=400,
                         detail=f"Car yard {cy_id} ({cy.name}) has required_days {[d.value for d in missing_days]} that are not in the scheduled days {[d.value for d in days]}."
@@ -372,11 +804,6 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
                         status_code=400,
                         detail=f"Linked yard gap must be non-negative between {cy_id} and {linked_id}."
                     )
-                if visits_required > 1:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Linked yard {cy_id} cannot require more than one visit per week."
-                    )
                 key = tuple(sorted((cy_id, linked_id)))
                 if key in link_pairs and link_pairs[key] != gap_days:
                     raise HTTPException(
@@ -385,31 +812,35 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
                     )
                 link_pairs[key] = gap_days
 
-    # Ensure linked yards have compatible visit counts
-    for (source_id, target_id), gap in link_pairs.items():
-        # Check both source and target yards
-        for yard_id in [source_id, target_id]:
-            if yard_id in coverage_requirements:
-                visits, _ = coverage_requirements[yard_id]
-                if visits > 1:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Linked yard {yard_id} cannot require more than one visit per week."
-                    )
+    # Ensure linked yards have compatible visit counts: every yard on either end
+    # of a link is checked once, now that all visit requirements are known
+    linked_yard_ids = {cy for pair in link_pairs.keys() for cy in pair}
+    for yard_id in linked_yard_ids:
+        if coverage_requirements[yard_id][0] > 1:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Linked yard {yard_id} cannot require more than one visit per week."
+            )
 
-    # Employees may have region exclusions and availability constraints
-    # Combine both checks in a single loop for efficiency
-    for emp_id, emp in employees.items():
-        for cy_id, cy in car_yards.items():
-            # Check region exclusion
-            if emp.not_region and cy.region == emp.not_region:
-                for day in days:
-                    model.Add(x[(emp_id, cy_id, day)] == 0)
-            else:
-                # Check availability
-                for day in days:
-                    if day not in emp.available_days:
-                        model.Add(x[(emp_id, cy_id, day)] == 0)
+    # Number of employees at each yard per day, aggregated once and reused by the
+    # coverage bounds, the extra-employee penalty and the hours distribution below
+    employees_at_yard: Dict[Tuple[int, DayOfWeek], cp_model.IntVar] = {}
+    # Yards mostly share a few crew sizes, so each distinct domain is built once
+    count_domains: Dict[Tuple[int, int], cp_model.Domain] = {}
+    for j, (cy_id, cy) in enumerate(car_yards.items()):
+        # A yard is either empty or staffed within its min/max crew size
+        crew_size = (cy.min_employees, cy.max_employees)
+        count_domain = count_domains.get(crew_size)
+        if count_domain is None:
+            count_domain = cp_model.Domain.FromIntervals(
+                [[0, 0], [cy.min_employees, cy.max_employees]])
+            count_domains[crew_size] = count_domain
+        for k, day in enumerate(days):
+            count_var = model.NewIntVarFromDomain(
+                count_domain, f'employees_at_cy{cy_id}_{day}')
+            model.Add(count_var == cp_model.LinearExpr.Sum(
+                [emp_row[j][k] for emp_row in x_grid]))
+            employees_at_yard[(cy_id, day)] = count_var
 
     # Constraint 1 (UPDATED): If a yard is covered, it must have between min and max employees
     # If not covered, it has 0 employees
@@ -417,62 +848,60 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
     # Track which yard-days have employees working only that single yard (for penalty application)
     is_single_yard_only: Dict[Tuple[int, DayOfWeek], cp_model.IntVar] = {}
 
-    for cy_id, cy in car_yards.items():
-        for day in days:
-            employees_at_yard = sum(x[(emp_id, cy_id, day)]
-                                    for emp_id in employees.keys())
-
-            # If covered = 1, then employees_at_yard >= min_employees
-            # If covered = 0, then employees_at_yard >= 0 (always true)
-            model.Add(employees_at_yard >= cy.min_employees *
-                      covered[(cy_id, day)])
-
-            # If covered = 1, then employees_at_yard <= max_employees
-            # If covered = 0, then employees_at_yard <= 0 (forces 0 employees)
-            model.Add(employees_at_yard <= cy.max_employees *
-                      covered[(cy_id, day)])
+    # Whether each employee works two or more yards on a day, reified once per
+    # employee-day and shared by every yard rather than recomputed per yard.
+    # None where the employee has at most one assignable yard that day.
+    multi_yard = [[None] * len(days) for _ in emp_ids]
+    for i, emp_row in enumerate(x_grid):
+        for k, day in enumerate(days):
+            day_vars = [yard_row[k] for yard_row in emp_row
+                        if not isinstance(yard_row[k], int)]
+            if len(day_vars) < 2:
+                continue
+            works_multiple = model.NewBoolVar(
+                f'multi_yard_e{emp_ids[i]}_{day}')
+            yards_worked = cp_model.LinearExpr.Sum(day_vars)
+            model.Add(yards_worked >= 2).OnlyEnforceIf(works_multiple)
+            model.Add(yards_worked <= 1).OnlyEnforceIf(works_multiple.Not())
+            multi_yard[i][k] = works_multiple
+
+    for j, (cy_id, cy) in enumerate(car_yards.items()):
+        for k, day in enumerate(days):
+            yard_employee_count = employees_at_yard[(cy_id, day)]
+
+            # Reify the headcount on covered instead of big-M bounds:
+            # covered = 1 -> min_employees <= employees_at_yard <= max_employees
+            # covered = 0 -> employees_at_yard == 0
+            is_covered = covered[(cy_id, day)]
+            model.AddLinearConstraint(
+                yard_employee_count, cy.min_employees, cy.max_employees
+            ).OnlyEnforceIf(is_covered)
+            model.Add(yard_employee_count == 0).OnlyEnforceIf(is_covered.Not())
 
             # Check if any employee at this yard is working ONLY this yard (not working other yards)
             # Penalty should only apply when employees are working a single yard, not when doing multiple
             # This allows efficient multi-yard sequences (e.g., Joe and Sam doing Yard A then Yard B)
             employee_single_yard_vars = []
-            for emp_id in employees.keys():
+            for i, emp_id in enumerate(emp_ids):
                 # Check if employee is assigned to this yard
-                is_at_this_yard = x[(emp_id, cy_id, day)]
+                is_at_this_yard = x_grid[i][j][k]
+                if isinstance(is_at_this_yard, int):
+                    continue
 
-                # Count how many OTHER yards this employee works on the same day
-                other_yards_worked = sum(
-                    x[(emp_id, other_cy_id, day)]
-                    for other_cy_id in car_yards.keys()
-                    if other_cy_id != cy_id
-                )
+                works_multiple = multi_yard[i][k]
+                if works_multiple is None:
+                    # No other yard is possible, so being here means single-yard
+                    employee_single_yard_vars.append(is_at_this_yard)
+                    continue
 
-                # Employee is working ONLY this yard if:
-                # - They're assigned to this yard (is_at_this_yard == 1)
-                # - AND they're not working any other yard (other_yards_worked == 0)
+                # emp_single_yard <=> is_at_this_yard AND NOT works_multiple,
+                # as clauses instead of a linear bound on the other yards' sum
                 emp_single_yard = model.NewBoolVar(
                     f'emp_single_yard_e{emp_id}_cy{cy_id}_{day}')
-
-                # emp_single_yard == 1 if and only if (is_at_this_yard == 1 AND other_yards_worked == 0)
-                # Constraint 1: emp_single_yard can only be 1 if employee is at this yard
-                model.Add(emp_single_yard <= is_at_this_yard)
-
-                # Constraint 2: emp_single_yard can only be 1 if employee works no other yards
-                # If emp_single_yard == 1, then other_yards_worked == 0
-                max_other_yards = len(car_yards) - 1
-                model.Add(other_yards_worked <=
-                          max_other_yards * (1 - emp_single_yard))
-
-                # Constraint 3: If employee is at this yard and works no other yards, emp_single_yard must be 1
-                # We encode: if (is_at_this_yard == 1 AND other_yards_worked == 0), then emp_single_yard == 1
-                # Using: emp_single_yard >= is_at_this_yard - other_yards_worked
-                # This works because:
-                # - If is_at_this_yard == 0: emp_single_yard >= 0 - other_yards_worked (no constraint, but emp_single_yard <= 0 from constraint 1)
-                # - If is_at_this_yard == 1 and other_yards_worked == 0: emp_single_yard >= 1 (forces it to 1)
-                # - If is_at_this_yard == 1 and other_yards_worked >= 1: emp_single_yard >= 1 - 1 = 0 (allows 0, and constraint 2 prevents 1)
-                model.Add(emp_single_yard >=
-                          is_at_this_yard - other_yards_worked)
-
+                model.AddBoolAnd([is_at_this_yard, works_multiple.Not()]).OnlyEnforceIf(
+                    emp_single_yard)
+                model.AddBoolOr(
+                    [is_at_this_yard.Not(), works_multiple, emp_single_yard])
                 employee_single_yard_vars.append(emp_single_yard)
 
             # Check if ANY employee at this yard is working only this yard (single yard only)
@@ -480,116 +909,105 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
             any_employee_single_yard = model.NewBoolVar(
                 f'any_emp_single_yard_cy{cy_id}_{day}')
             is_single_yard_only[(cy_id, day)] = any_employee_single_yard
-
-            # If any employee is single-yard, then any_employee_single_yard == 1
-            for emp_single_yard_var in employee_single_yard_vars:
-                model.Add(emp_single_yard_var <= any_employee_single_yard)
-            # If any_employee_single_yard == 1, then at least one employee must be single-yard
-            model.Add(any_employee_single_yard <=
-                      sum(employee_single_yard_vars))
+            _add_reified_or(model, any_employee_single_yard,
+                            employee_single_yard_vars)
 
             # Calculate extra employees above minimum
-            extra_employees = employees_at_yard - \
+            extra_employees = yard_employee_count - \
                 cy.min_employees * covered[(cy_id, day)]
 
-            # Only apply penalty if:
-            # 1. Yard is covered (covered == 1)
-            # 2. At least one employee is working only this yard (any_employee_single_yard == 1)
-            # 3. There are extra employees above minimum
-            # penalty_amount = extra_employees if (covered == 1 AND any_employee_single_yard == 1), else 0
-            penalty_amount = model.NewIntVar(
-                0, len(employees), f'penalty_amount_cy{cy_id}_{day}')
-
-            # Upper bounds: penalty cannot exceed extra_employees, and only applies when both conditions are true
-            model.Add(penalty_amount <= extra_employees)
-            model.Add(penalty_amount <= covered[(cy_id, day)] * len(employees))
-            model.Add(penalty_amount <=
-                      any_employee_single_yard * len(employees))
-
-            # Lower bound: if both conditions are true, penalty should equal extra_employees
-            # penalty_amount >= extra_employees - M * (1 - covered) - M * (1 - any_employee_single_yard)
-            max_penalty = len(employees)
-            model.Add(penalty_amount >= extra_employees -
-                      max_penalty * (1 - covered[(cy_id, day)]))
-            model.Add(penalty_amount >= extra_employees -
-                      max_penalty * (1 - any_employee_single_yard))
-
-            extra_employee_penalties.append(penalty_amount)
+            # Extra employees above minimum are penalized, and are only allowed
+            # at all when at least one employee works only this yard. Reified on
+            # that indicator instead of big-M bounds on a penalty variable (an
+            # uncovered yard has no employees, so its extra count is already 0)
+            model.Add(extra_employees == 0).OnlyEnforceIf(
+                any_employee_single_yard.Not())
+            extra_employee_penalties.append(extra_employees)
 
     # Constraint 2: Limit total hours per employee per day
     # Distribute total yard hours across assigned employees while respecting per-employee limits
-    SCALE_FACTOR = MINUTES_PER_HOUR  # Convert hours to minutes for integer arithmetic
+    max_minutes = int(request.max_hours_per_day * SCALE_FACTOR)
     work_minutes: Dict[Tuple[int, int, DayOfWeek], cp_model.IntVar] = {}
-    employee_day_minutes: Dict[Tuple[int, DayOfWeek], cp_model.IntVar] = {}
-    for cy_id, cy in car_yards.items():
-        total_minutes = int(cy.hours_required * SCALE_FACTOR)
-        for day in days:
+    # Per-assignment minutes for yards with a fixed crew that splits their work evenly
+    fixed_crew_load: Dict[int, int] = {}
+    for j, (cy_id, cy) in enumerate(car_yards.items()):
+        total_minutes = yard_minutes[cy_id]
+        if (cy.min_employees == cy.max_employees
+                and total_minutes % cy.min_employees == 0):
+            # With a fixed crew and no rounding remainder each assignee's share is
+            # constant, so charge it straight against the daily limit instead of
+            # creating per-employee work variables. Uneven splits keep the work
+            # variables so the solver can still choose who absorbs the remainder
+            fixed_crew_load[cy_id] = total_minutes // cy.min_employees
+            continue
+
+        # Base minutes each assigned employee receives for every feasible headcount
+        # (an uncovered yard has no employees and therefore no work). Headcounts
+        # whose share already exceeds the daily limit can never be used.
+        share_table = [(0, 0)] + [
+            (count, total_minutes // count)
+            for count in range(cy.min_employees, cy.max_employees + 1)
+            if total_minutes // count <= max_minutes
+        ]
+        share_domain = cp_model.Domain.FromValues(
+            [minutes for _, minutes in share_table])
+        # Nobody works more than the largest usable share plus the rounding
+        # minute, nor more than the daily limit
+        max_work_minutes = min(total_minutes, max_minutes,
+                               max(minutes for _, minutes in share_table) + 1)
+        for k, day in enumerate(days):
+            share = model.NewIntVarFromDomain(
+                share_domain, f'share_cy{cy_id}_d{day}')
+            # Strictly redundant (the per-employee bounds and the covered total
+            # below already determine the share), but tying share to the
+            # headcount lets propagation prune both at once, which proves
+            # optimality markedly faster than the O(E) bounds alone
+            model.AddAllowedAssignments(
+                [employees_at_yard[(cy_id, day)], share], share_table)
+
             work_vars = []
-            for emp_id in employees.keys():
+            for emp_id, emp_row in zip(emp_ids, x_grid):
+                is_assigned = emp_row[j][k]
+                if isinstance(is_assigned, int):
+                    continue
                 work_var = model.NewIntVar(
-                    0, total_minutes,
+                    0, max_work_minutes,
                     f'work_e{emp_id}_cy{cy_id}_d{day}')
                 work_minutes[(emp_id, cy_id, day)] = work_var
-                model.Add(work_var == 0).OnlyEnforceIf(
-                    x[(emp_id, cy_id, day)].Not())
-                model.Add(work_var <= total_minutes).OnlyEnforceIf(
-                    x[(emp_id, cy_id, day)])
+                # Enforce approximately equal work distribution: every assigned employee
+                # works the base share or one minute more to absorb integer rounding.
+                # Together with the total below this matches the post-processing
+                # assumption of hours_required / num_employees each.
+                # Gated on the assignment literal:
+                # - not assigned: work_var == 0
+                # - assigned: share <= work_var <= share + 1
+                model.Add(work_var == 0).OnlyEnforceIf(is_assigned.Not())
+                model.Add(work_var <= share + 1)
+                model.Add(work_var >= share).OnlyEnforceIf(is_assigned)
                 work_vars.append(work_var)
 
-            total_work = sum(work_vars)
-            model.Add(total_work == total_minutes).OnlyEnforceIf(
+            # Unassigned employees already contribute zero, so only the covered case needs a total
+            model.Add(cp_model.LinearExpr.Sum(work_vars) == total_minutes).OnlyEnforceIf(
                 covered[(cy_id, day)])
-            model.Add(total_work == 0).OnlyEnforceIf(
-                covered[(cy_id, day)].Not())
-
-            # Enforce approximately equal work distribution
-            # When a yard is covered, all assigned employees should work approximately the same amount
-            # This ensures consistency between solver distribution and post-processing assumption
-            # Approach: for any two assigned employees, their work difference is at most 1 minute
-            # This allows for integer rounding while keeping distribution fair
-            if len(employees) > 1:
-                # Only enforce when yard is covered and there are multiple employees
-                # For each pair of employees, if both are assigned, their work should differ by at most 1 minute
-                emp_id_list = list(employees.keys())
-                for i in range(len(emp_id_list)):
-                    for j in range(i + 1, len(emp_id_list)):
-                        emp_i_id = emp_id_list[i]
-                        emp_j_id = emp_id_list[j]
-                        work_i = work_minutes[(emp_i_id, cy_id, day)]
-                        work_j = work_minutes[(emp_j_id, cy_id, day)]
-
-                        # If both employees are assigned, their work difference should be <= 1
-                        # This is enforced via: if both x[i] and x[j] are 1, then |work_i - work_j| <= 1
-                        # We use: work_i - work_j <= 1 when both assigned, and work_j - work_i <= 1 when both assigned
-                        diff_ij = model.NewIntVar(-total_minutes, total_minutes,
-                                                  f'diff_ij_e{emp_i_id}_e{emp_j_id}_cy{cy_id}_d{day}')
-                        model.Add(diff_ij == work_i - work_j)
-
-                        # When both are assigned, enforce |diff_ij| <= 1
-                        # both_assigned == 1 if and only if both x[i] and x[j] are 1
-                        both_assigned = model.NewBoolVar(
-                            f'both_e{emp_i_id}_e{emp_j_id}_cy{cy_id}_d{day}')
-                        model.Add(both_assigned <= x[(emp_i_id, cy_id, day)])
-                        model.Add(both_assigned <= x[(emp_j_id, cy_id, day)])
-                        model.Add(both_assigned >= x[(emp_i_id, cy_id, day)] +
-                                  x[(emp_j_id, cy_id, day)] - 1)
-
-                        # When both assigned, diff_ij <= 1 and diff_ij >= -1
-                        model.Add(diff_ij <= 1).OnlyEnforceIf(both_assigned)
-                        model.Add(diff_ij >= -1).OnlyEnforceIf(both_assigned)
 
     # Now apply hours constraint per employee per day using distributed minutes
-    for emp_id in employees.keys():
-        for day in days:
-            total_minutes_worked = model.NewIntVar(
-                0, int(request.max_hours_per_day *
-                       SCALE_FACTOR * len(car_yards)),
-                f'total_minutes_e{emp_id}_d{day}')
-            employee_day_minutes[(emp_id, day)] = total_minutes_worked
-            model.Add(total_minutes_worked == sum(
-                work_minutes[(emp_id, cy_id, day)] for cy_id in car_yards.keys()))
-            max_minutes = int(request.max_hours_per_day * SCALE_FACTOR)
-            model.Add(total_minutes_worked <= max_minutes)
+    fixed_crew_columns = [(cy_index[cy_id], load)
+                          for cy_id, load in fixed_crew_load.items()]
+    for i, emp_id in enumerate(emp_ids):
+        emp_row = x_grid[i]
+        for k, day in enumerate(days):
+            # Variable work minutes count once each, fixed-crew assignments
+            # count their constant load
+            day_terms = [work_minutes[(emp_id, cy_id, day)] for cy_id in cy_ids
+                         if (emp_id, cy_id, day) in work_minutes]
+            day_coeffs = [1] * len(day_terms)
+            for j, load in fixed_crew_columns:
+                if not isinstance(emp_row[j][k], int):
+                    day_terms.append(emp_row[j][k])
+                    day_coeffs.append(load)
+            if day_terms:
+                model.Add(cp_model.LinearExpr.WeightedSum(
+                    day_terms, day_coeffs) <= max_minutes)
 
     # Constraint 2b: Optional grouping constraint - encourage yards from same group together
     # This is a soft preference (handled by bonus), but we can add a constraint to prevent
@@ -597,7 +1015,6 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
     # (This is optional - removing it makes grouping purely preference-based via bonus)
 
     # Constraint 3: Car yard visit frequency and spacing (per_week)
-    linked_yard_ids = {cy for pair in link_pairs.keys() for cy in pair}
 
     for cy_id, cy in car_yards.items():
         required_visits, min_gap = coverage_requirements[cy_id]
@@ -610,10 +1027,11 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
         requires_exact_coverage = (
             not is_linked and (bool(cy.per_week) or bool(cy.required_days))
         )
+        visits = cp_model.LinearExpr.Sum(coverage_vars)
         if requires_exact_coverage:
-            model.Add(sum(coverage_vars) == required_visits)
+            model.Add(visits == required_visits)
         elif not is_linked:
-            model.Add(sum(coverage_vars) <= required_visits)
+            model.Add(visits <= required_visits)
 
         if is_linked:
             if cy.required_days and len(cy.required_days) > 1:
@@ -621,29 +1039,40 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
                     status_code=400,
                     detail=f"Linked yard {cy_id} cannot have multiple required days."
                 )
-            model.Add(sum(coverage_vars) == 1)
+            model.Add(visits == 1)
+
+        # Mandatory visits need enough days with a full minimum crew available
+        mandatory_visits = 1 if is_linked else (
+            required_visits if requires_exact_coverage else 0)
+        staffable_days = sum(
+            eligible_count.get((cy_id, day), 0) >= cy.min_employees for day in days)
+        if staffable_days < mandatory_visits:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Car yard {cy_id} ({cy.name}) requires {mandatory_visits} visit(s) but only {staffable_days} scheduled day(s) have at least {cy.min_employees} eligible employees."
+            )
 
         if required_visits > 1 and min_gap > 0:
-            for i in range(len(days)):
-                for j in range(i + 1, len(days)):
-                    if day_index[days[j]] - day_index[days[i]] < min_gap:
-                        model.AddBoolOr([
-                            coverage_vars[i].Not(),
-                            coverage_vars[j].Not()
-                        ])
+            # Any two visits closer than min_gap days share a window starting at
+            # the earlier one, so one AtMostOne per window covers every pair.
+            # Windows running past the last day are contained in the last full
+            # one, so only full windows (or the whole schedule if shorter) are added
+            for i in range(max(1, len(days) - min_gap + 1)):
+                model.AddAtMostOne(coverage_vars[i:i + min_gap])
 
         # Constraint 3b: When both required_days and per_week are set,
         # ensure at least one visit occurs on a required day
         if cy.required_days and cy.per_week:
             # At least one visit must occur on one of the required days
             required_day_coverage_vars = [
-                covered[(cy_id, day)]
-                for day in days
-                if day in cy.required_days
+                coverage_vars[k]
+                for k, day in enumerate(days)
+                if day in yard_required_days[cy_id]
             ]
             if required_day_coverage_vars:
                 # At least one of the required days must be covered
-                model.Add(sum(required_day_coverage_vars) >= 1)
+                model.Add(cp_model.LinearExpr.Sum(
+                    required_day_coverage_vars) >= 1)
 
     # Constraint 4: Linked yards must be within the specified gap
     for (source_id, target_id), gap_days in link_pairs.items():
@@ -656,26 +1085,26 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
                           covered[(target_id, day)])
             continue
 
-        for day_a in days:
-            for day_b in days:
-                diff = abs(day_index[day_a] - day_index[day_b])
-                if diff < gap_days:
-                    model.AddBoolOr([
-                        covered[(source_id, day_a)].Not(),
-                        covered[(target_id, day_b)].Not()
-                    ])
+        # Both yards are visited exactly once, so visits closer than gap_days
+        # apart are exactly the pairs sharing a window of gap_days consecutive days
+        # (truncated windows at the end are contained in the last full one)
+        for i in range(max(1, len(days) - gap_days + 1)):
+            window = days[i:i + gap_days]
+            model.AddAtMostOne(
+                [covered[(source_id, day)] for day in window] +
+                [covered[(target_id, day)] for day in window])
 
-    # Constraint 5: Employee availability is already handled above (combined with region exclusion)
+    # Constraint 5: Employee availability and region exclusions are handled by variable creation above
 
     # Objective 1: Prefer higher reliability-rated employees (higher rating = better)
     # EmployeeReliabilityRating: EXCELLENT=10, ACCEPTABLE=7, BELOW_AVERAGE=5
-    quality_score = []
-    for emp_id, emp in employees.items():
-        for cy_id in car_yards.keys():
-            for day in days:
-                # Use the reliability rating value directly (higher is better)
-                weight = emp.ranking.value
-                quality_score.append(x[(emp_id, cy_id, day)] * weight)
+    # Use the reliability rating value directly (higher is better)
+    emp_weight = {emp_id: emp.ranking.value
+                  for emp_id, emp in employees.items()}
+    # The weight only depends on the employee, so weight each employee's shift
+    # total instead of every individual assignment
+    quality_score = cp_model.LinearExpr.WeightedSum(
+        shift_totals, [emp_weight[emp_id] for emp_id in emp_ids])
 
     # NEW Objective 2: Prioritize high-priority car yards
     # Give higher weight to covering high-priority yards
@@ -684,26 +1113,34 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
         CarYardPriority.MEDIUM: PRIORITY_WEIGHT_MEDIUM,
         CarYardPriority.LOW: PRIORITY_WEIGHT_LOW
     }
-    priority_score = []
-    for cy_id, cy in car_yards.items():
-        for day in days:
-            weight = priority_weights.get(cy.priority, 1)
-            priority_score.append(covered[(cy_id, day)] * weight)
+    cy_weight = {cy_id: priority_weights.get(cy.priority, 1)
+                 for cy_id, cy in car_yards.items()}
+    # Yard-days that can never reach the minimum crew are pinned uncovered, so
+    # leave them out of the objective
+    coverable = [(cy_id, day) for cy_id, day in covered.keys()
+                 if eligible_count.get((cy_id, day), 0) >= car_yards[cy_id].min_employees]
+    priority_score = cp_model.LinearExpr.WeightedSum(
+        [covered[key] for key in coverable], [cy_weight[cy_id] for cy_id, _ in coverable])
 
     # Objective 3: Balance workload - minimize difference between max and min shifts
-    shifts_per_employee = []
-    for emp_id in employees.keys():
-        total = sum(x[(emp_id, cy_id, day)]
-                    for cy_id in car_yards.keys()
-                    for day in days)
-        shifts_per_employee.append(total)
+    shifts_per_employee = shift_totals
 
-    min_shifts = model.NewIntVar(0, len(days) * len(car_yards), 'min_shifts')
-    max_shifts = model.NewIntVar(0, len(days) * len(car_yards), 'max_shifts')
-
-    for total in shifts_per_employee:
-        model.Add(min_shifts <= total)
-        model.Add(max_shifts >= total)
+    # An employee can take at most one shift per assignment variable they have
+    max_possible_shifts = [
+        sum(not isinstance(var, int) for yard_row in emp_row for var in yard_row)
+        for emp_row in x_grid
+    ]
+    min_shifts = model.NewIntVar(0, min(max_possible_shifts), 'min_shifts')
+    max_shifts = model.NewIntVar(0, max(max_possible_shifts), 'max_shifts')
+    # Channel each total through a bounded IntVar so the min/max propagators
+    # work on plain variables (measured faster than passing the sums directly)
+    shift_total_vars = []
+    for emp_id, total, bound in zip(emp_ids, shifts_per_employee, max_possible_shifts):
+        total_var = model.NewIntVar(0, bound, f'shifts_{emp_id}')
+        model.Add(total_var == total)
+        shift_total_vars.append(total_var)
+    model.AddMinEquality(min_shifts, shift_total_vars)
+    model.AddMaxEquality(max_shifts, shift_total_vars)
 
     workload_balance = max_shifts - min_shifts
 
@@ -711,134 +1148,427 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
     # This encourages grouped yards to be done together by the same employee
     # The bonus increases with the number of yards worked in the group on the same day
     # Example: If an employee works 2 yards in a group on Monday, bonus = 2 * 50 = 100
-    grouping_bonus = []
-    if request.yard_groups:
-        for group_name, cy_ids in request.yard_groups.items():
-            for emp_id in employees.keys():
-                for day in days:
-                    # Count how many yards in this group the employee works on this day
-                    yards_worked_in_group = sum(x[(emp_id, cy_id, day)]
-                                                for cy_id in cy_ids
-                                                if cy_id in car_yards.keys())
-                    # Bonus increases with the number of yards worked in the group
-                    # This encourages grouping but doesn't force it
-                    # (works as a soft constraint via objective function)
-                    grouping_bonus.append(
-                        yards_worked_in_group * GROUPING_BONUS_BASE_WEIGHT)
+    # Bonus increases with the number of yards worked in the group
+    # This encourages grouping but doesn't force it
+    # (works as a soft constraint via objective function)
+    # Every assignment to a grouped yard earns the bonus once per group listing
+    # the yard, so the groups are folded into a per-yard weight up front
+    group_listings: Dict[int, int] = {}
+    for group_cy_ids in (request.yard_groups or {}).values():
+        for cy_id in group_cy_ids:
+            group_listings[cy_id] = group_listings.get(cy_id, 0) + 1
+    grouped_vars = []
+    grouped_weights = []
+    if group_listings:
+        for (_, cy_id, _), var in x.items():
+            listings = group_listings.get(cy_id)
+            if listings:
+                grouped_vars.append(var)
+                grouped_weights.append(GROUPING_BONUS_BASE_WEIGHT * listings)
+    grouping_bonus = cp_model.LinearExpr.WeightedSum(
+        grouped_vars, grouped_weights)
 
     # Combined objective: prioritize high-priority yards, maximize quality, minimize workload imbalance
     # Add grouping bonus to encourage grouped yards to be done together
-    total_assignments = sum(
-        x[(emp_id, cy_id, day)]
-        for emp_id in employees.keys()
-        for cy_id in car_yards.keys()
-        for day in days
-    )
+    total_assignments = cp_model.LinearExpr.Sum(list(x.values()))
 
     partial_overlap_penalties = []
 
-    sorted_cy_ids = sorted(car_yards.keys())
-    for day in days:
+    sorted_cy_ids = sorted(cy_ids)
+    for k, day in enumerate(days):
+        # Per-yard columns of this day's assignment variables across employees
+        day_columns = {cy_id: [emp_row[cy_index[cy_id]][k] for emp_row in x_grid]
+                       for cy_id in sorted_cy_ids}
+        # Employees (by position) who can work each yard on this day. A yard
+        # with fewer eligible employees than its minimum crew is never staffed
+        # that day, so it gets none and drops out of every pair below
+        eligible_rows = {}
+        for cy_id, column in day_columns.items():
+            rows = frozenset(i for i, var in enumerate(column)
+                             if not isinstance(var, int))
+            if len(rows) < car_yards[cy_id].min_employees:
+                rows = frozenset()
+            eligible_rows[cy_id] = rows
         for idx_a in range(len(sorted_cy_ids)):
             cy_a = sorted_cy_ids[idx_a]
             for idx_b in range(idx_a + 1, len(sorted_cy_ids)):
                 cy_b = sorted_cy_ids[idx_b]
+                # Without an employee who can work both yards nobody can share
+                # them, so the penalty is always 0
+                if eligible_rows[cy_a].isdisjoint(eligible_rows[cy_b]):
+                    continue
                 mix_var = _create_partial_overlap_penalty(
-                    model, employees, cy_a, cy_b, day, x
+                    model, cy_a, cy_b, day,
+                    day_columns[cy_a], day_columns[cy_b]
                 )
                 partial_overlap_penalties.append(mix_var)
 
-    objective_components = [
-        # Highest priority: cover high-priority yards
-        sum(priority_score) * OBJECTIVE_PRIORITY_WEIGHT,
-        # Second: use better employees
-        sum(quality_score) * OBJECTIVE_QUALITY_WEIGHT,
-        # Third: encourage grouping (weight 10x the base bonus)
-        sum(grouping_bonus) * OBJECTIVE_GROUPING_WEIGHT,
-        # Fourth: balance workload (penalty for imbalance)
-        -workload_balance * OBJECTIVE_BALANCE_WEIGHT,
+    # (term, weight) pairs combined into one WeightedSum below
+    secondary_objective_components = [
+        # Use better employees
+        (quality_score, OBJECTIVE_QUALITY_WEIGHT),
+        # Encourage grouping (scaled by the base bonus)
+        (grouping_bonus, OBJECTIVE_GROUPING_WEIGHT),
+        # Balance workload (penalty for imbalance)
+        (workload_balance, -OBJECTIVE_BALANCE_WEIGHT),
         # Discourage assigning more employees than necessary
-        -sum(extra_employee_penalties) * OBJECTIVE_EXTRA_EMPLOYEE_WEIGHT,
+        (cp_model.LinearExpr.Sum(extra_employee_penalties), -OBJECTIVE_EXTRA_EMPLOYEE_WEIGHT),
         # Mild penalty on total assignments to avoid redundant coverage
-        -total_assignments * OBJECTIVE_ASSIGNMENT_PENALTY,
+        (total_assignments, -OBJECTIVE_ASSIGNMENT_PENALTY),
         # Penalize partial overlaps where new employees join existing crews mid-day
-        -sum(partial_overlap_penalties) * OBJECTIVE_PARTIAL_OVERLAP_WEIGHT
+        (cp_model.LinearExpr.Sum(partial_overlap_penalties), -OBJECTIVE_PARTIAL_OVERLAP_WEIGHT)
     ]
+    terms, weights = zip(*secondary_objective_components)
+
+    # Warm-start from a greedy roster so the first solve spends less time
+    # searching for an initial feasible solution
+    greedy_assignments, greedy_covered = _greedy_hint(
+        employees, car_yards, days, max_minutes, coverage_requirements)
+    for key, var in x.items():
+        model.AddHint(var, greedy_assignments.get(key, 0))
+    for key, var in covered.items():
+        model.AddHint(var, greedy_covered.get(key, 0))
+    # Complete the hint with the workload bounds the greedy roster implies
+    greedy_shifts = {emp_id: 0 for emp_id in emp_ids}
+    for emp_id, _, _ in greedy_assignments.keys():
+        greedy_shifts[emp_id] += 1
+    for emp_id, total_var in zip(emp_ids, shift_total_vars):
+        model.AddHint(total_var, greedy_shifts[emp_id])
+    model.AddHint(min_shifts, min(greedy_shifts.values()))
+    model.AddHint(max_shifts, max(greedy_shifts.values()))
+    # Priority coverage of the greedy roster, the floor a preview must reach
+    hint_priority = sum(cy_weight[cy_id] for cy_id, day in coverable
+                        if greedy_covered.get((cy_id, day), 0))
+
+    return _RosterModel(
+        model=model,
+        employees=employees,
+        car_yards=car_yards,
+        days=days,
+        emp_names=emp_names,
+        yard_minutes=yard_minutes,
+        x=x,
+        covered=covered,
+        work_minutes=work_minutes,
+        fixed_crew_load=fixed_crew_load,
+        priority_objective=priority_score,
+        hint_priority=hint_priority,
+        secondary_objective=cp_model.LinearExpr.WeightedSum(terms, weights)
+    )
+
+
+def _configure_solver(
+    solver: cp_model.CpSolver,
+    time_limit: float,
+    num_workers: int,
+    yard_days: int,
+    solver_params: Optional[Dict[str, Any]]
+) -> None:
+    """
+    Apply the tuning profile, then any per-request overrides, to a stage's solver.
 
-    model.Maximize(sum(objective_components))
+    Args:
+        solver: The solver to configure
+        time_limit: Time budget for this stage in seconds
+        num_workers: Parallel search workers
+        yard_days: Number of (car yard, day) pairs, used to pick the linearization level
+        solver_params: Optional SatParameters overrides, by field name
+    """
+    params = solver.parameters
+    params.max_time_in_seconds = time_limit
+    params.num_workers = num_workers
+    params.symmetry_level = 2
+    params.core_minimization_level = 1
+    params.cp_model_probing_level = SOLVER_PROBING_LEVEL
+    params.linearization_level = 2 if yard_days < LINEARIZATION_MAX_YARD_DAYS else 1
+    params.log_search_progress = SOLVER_LOG_ENABLED
+    if SOLVER_LOG_ENABLED:
+        params.log_to_stdout = False
+        solver.log_callback = logging.getLogger(__name__).info
+    for name, value in (solver_params or {}).items():
+        try:
+            setattr(params, name, value)
+        except (AttributeError, TypeError, ValueError) as exc:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid solver parameter '{name}': {exc}"
+            )
 
-    # Solve
+
+def _validate_solver_params(solver_params: Optional[Dict[str, Any]]) -> None:
+    """
+    Reject caller-supplied solver_params that aren't allowed search-tuning
+    parameters or whose values are out of range.
+
+    Args:
+        solver_params: The request's SatParameters overrides, by field name
+
+    Raises:
+        HTTPException: 400 naming the first offending parameter
+    """
+    for name, value in (solver_params or {}).items():
+        if name in SOLVER_TUNING_FIELDS:
+            detail = f"Solver parameter '{name}' must be set with the request field '{name}'"
+        elif name not in ALLOWED_SOLVER_PARAMS:
+            detail = (f"Solver parameter '{name}' cannot be overridden; allowed: " +
+                      ", ".join(sorted(ALLOWED_SOLVER_PARAMS)))
+        elif name in SOLVER_BOOL_PARAMS and not isinstance(value, bool):
+            detail = f"Solver parameter '{name}' must be true or false"
+        elif name in SOLVER_PARAM_RANGES and (
+                isinstance(value, bool) or not isinstance(value, int)
+                or not SOLVER_PARAM_RANGES[name][0] <= value <= SOLVER_PARAM_RANGES[name][1]):
+            low, high = SOLVER_PARAM_RANGES[name]
+            detail = f"Solver parameter '{name}' must be an integer between {low} and {high}"
+        else:
+            continue
+        raise HTTPException(status_code=400, detail=detail)
+
+
+def _solve_stage(
+    model: cp_model.CpModel,
+    objective: Any,
+    time_limit: float,
+    num_workers: int,
+    yard_days: int,
+    solver_params: Optional[Dict[str, Any]],
+    repair_hint: bool = False
+) -> Tuple[cp_model.CpSolver, Any]:
+    """
+    Maximise one objective of the lexicographic solve with a fresh solver.
+
+    Constraints fixing earlier stages and the hints to start from must already
+    be on the model.
+
+    Args:
+        model: The CP-SAT model, including constraints from earlier stages
+        objective: Linear expression to maximise in this stage
+        time_limit: Time budget for this stage in seconds
+        num_workers: Parallel search workers
+        yard_days: Number of (car yard, day) pairs, used by the tuning profile
+        solver_params: Optional SatParameters overrides, by field name
+        repair_hint: Let the solver repair an infeasible hint instead of dropping it
+
+    Returns:
+        Tuple of (solver, status) after solving
+    """
+    model.Maximize(objective)
     solver = cp_model.CpSolver()
-    solver.parameters.max_time_in_seconds = DEFAULT_SOLVER_TIMEOUT_SECONDS
+    _configure_solver(solver, time_limit, num_workers,
+                      yard_days, solver_params)
+    if repair_hint:
+        solver.parameters.repair_hint = True
     status = solver.Solve(model)
+    return solver, status
+
+
+def _solution_values(solver: cp_model.CpSolver,
+                     variables: Iterable[cp_model.IntVar]) -> List[int]:
+    """Values of plain (non-negated) variables in the solver's last solution"""
+    # Reading the response's solution array once avoids a solver call per
+    # variable; BooleanValues/Values are slower still as they build a Series
+    solution = solver.ResponseProto().solution
+    return [solution[var.Index()] for var in variables]
+
+
+@lru_cache(maxsize=MODEL_CACHE_SIZE)
+def _build_roster_model_cached(request_json: str) -> _RosterModel:
+    """
+    Build the model for a serialized request (without solver-only fields),
+    reusing it for requests that only differ in solver settings.
+
+    The cached model must not be mutated: callers solve a Clone() of it. Variable
+    objects in the result stay valid for the clone since they refer to proto
+    indices. Validation failures raise HTTPException and are never cached.
+    """
+    return _build_roster_model(ScheduleRequest.model_validate_json(request_json))
+
+
+def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
+    """
+    Solve the rostering problem using OR-Tools CP-SAT solver
+
+    Constraints:
+    - Each yard must have min-max employees if covered
+    - Yards respect required days, visit counts, spacing rules, and linked-yard gaps
+    - Employees can work multiple yards per day, limited by max_hours_per_day
+    - Employees can only work on available days and avoid excluded regions
+    - Grouping bonus encourages yards in the same group to be done together
+
+    Objectives (in priority order):
+    1. Cover high-priority yards first
+    2. Use higher reliability-rated employees
+    3. Encourage grouping (yards in same group done together)
+    4. Balance workload across employees
+    """
+    # Initialize logger once
+    logger = logging.getLogger(__name__)
+
+    built = _build_roster_model_cached(
+        request.model_dump_json(exclude=SOLVER_ONLY_FIELDS))
+    # Each solve adds its own stage constraints and hints, so work on a copy
+    model = built.model.Clone()
+    employees = built.employees
+    car_yards = built.car_yards
+    days = built.days
+    emp_names = built.emp_names
+    yard_minutes = built.yard_minutes
+    x = built.x
+    covered = built.covered
+    work_minutes = built.work_minutes
+    fixed_crew_load = built.fixed_crew_load
+
+    if request.num_search_workers:
+        num_workers = min(request.num_search_workers, MAX_SOLVER_NUM_WORKERS)
+    elif len(x) <= SMALL_MODEL_MAX_ASSIGNMENTS:
+        num_workers = 1
+    else:
+        num_workers = min(
+            max(1, (os.cpu_count() or DEFAULT_SOLVER_NUM_WORKERS)
+                // (API_WORKERS * CONCURRENT_SOLVES)),
+            MAX_SOLVER_NUM_WORKERS)
+
+    # Only parameters the caller set override the tuning profile
+    solver_overrides = {name: getattr(request, name)
+                        for name in SOLVER_TUNING_FIELDS
+                        if getattr(request, name) is not None}
+    # Previews stop at the first feasible roster (normally the repaired greedy
+    # hint) unless the caller's solver_params say otherwise
+    if request.preview:
+        solver_overrides = {"stop_after_first_solution": True,
+                            **solver_overrides}
+    _validate_solver_params(request.solver_params)
+    solver_overrides.update(request.solver_params or {})
+    yard_days = len(covered)
+
+    # Solve lexicographically instead of packing everything into one weighted sum:
+    # Stage 1 maximises priority coverage on its own. The greedy hint ignores
+    # linked-yard gaps and symmetry ordering, so let the solver repair it rather
+    # than discard it
+    total_priority = built.priority_objective
+    if request.time_limit_seconds:
+        time_budget = request.time_limit_seconds
+    elif request.preview:
+        time_budget = PREVIEW_SOLVER_TIMEOUT_SECONDS
+    else:
+        time_budget = DEFAULT_SOLVER_TIMEOUT_SECONDS
+    # Previews only run the first stage, so it gets the whole budget
+    stage_time_limit = (time_budget if request.preview else
+                        time_budget * PRIORITY_STAGE_TIME_FRACTION)
+    if request.preview:
+        # Stage 1 requires no coverage, so its first solution can be the empty
+        # roster. Only stop at a roster covering at least as much as the greedy
+        # hint; the hint may break linked-yard gaps, so if that bound can't be
+        # met fall back to a normal stage 1 solve in the remaining time
+        preview_model = model.Clone()
+        preview_model.Add(total_priority >= max(built.hint_priority, 1))
+        solver, status = _solve_stage(
+            preview_model, total_priority, stage_time_limit,
+            num_workers, yard_days, solver_overrides, repair_hint=True)
+        solve_time_seconds = solver.WallTime()
+        if status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            fallback_overrides = {name: value for name, value in solver_overrides.items()
+                                  if name != "stop_after_first_solution"}
+            solver, status = _solve_stage(
+                model, total_priority,
+                max(stage_time_limit - solve_time_seconds, MIN_STAGE_TIME_SECONDS),
+                num_workers, yard_days, fallback_overrides, repair_hint=True)
+            solve_time_seconds += solver.WallTime()
+    else:
+        solver, status = _solve_stage(
+            model, total_priority, stage_time_limit,
+            num_workers, yard_days, solver_overrides, repair_hint=True)
+        solve_time_seconds = solver.WallTime()
+
+    # Stage 2 fixes the achieved priority coverage and optimises the remaining
+    # objectives, warm-started from the stage 1 solution. Previews skip it
+    if status in [cp_model.OPTIMAL, cp_model.FEASIBLE] and not request.preview:
+        model.Add(total_priority >= round(solver.ObjectiveValue()))
+        model.ClearHints()
+        for var, value in zip(x.values(), _solution_values(solver, x.values())):
+            model.AddHint(var, value)
+        for var, value in zip(covered.values(),
+                              _solution_values(solver, covered.values())):
+            model.AddHint(var, value)
+
+        secondary_solver, secondary_status = _solve_stage(
+            model, built.secondary_objective,
+            time_budget * (1 - PRIORITY_STAGE_TIME_FRACTION),
+            num_workers, yard_days, solver_overrides)
+        solve_time_seconds += secondary_solver.WallTime()
+
+        # Keep the stage 1 solution if the second stage ran out of time
+        if secondary_status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            if status == cp_model.OPTIMAL:
+                status = secondary_status
+            solver = secondary_solver
+    elif status == cp_model.OPTIMAL:
+        # A preview only optimised priority coverage, so its roster is never optimal
+        status = cp_model.FEASIBLE
 
     # Build response (same as before)
-    # First collect raw assignment data (without creating Assignment objects yet)
-    raw_assignments = []
+    # First collect the assigned (emp_id, cy_id, day) keys (Assignment objects are
+    # built once timings are known). Solution values are fetched in one batch and
+    # only the true assignments are visited while accumulating stats
     if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-        for emp_id, emp in employees.items():
-            for cy_id, cy in car_yards.items():
-                for day in days:
-                    if solver.Value(x[(emp_id, cy_id, day)]) == 1:
-                        raw_assignments.append({
-                            "employee_id": emp_id,
-                            "employee_name": emp.name,
-                            "car_yard_id": cy_id,
-                            "car_yard_name": cy.name,
-                            "day": day
-                        })
-
-        if not raw_assignments:
+        shifts_count = {emp_id: 0 for emp_id in employees.keys()}
+        yards_covered = {}  # Track which yards were covered
+        assigned_keys = list(compress(
+            x.keys(), _solution_values(solver, x.values())))
+        for emp_id, cy_id, day in assigned_keys:
+            shifts_count[emp_id] += 1
+            yards_covered.setdefault((cy_id, day), []).append(emp_id)
+
+        if not assigned_keys:
             raise HTTPException(
                 status_code=400,
                 detail="No feasible assignments produced. Check availability, required days, or coverage limits."
             )
 
-        # Calculate stats from raw assignments
-        shifts_count = {emp_id: 0 for emp_id in employees.keys()}
-        yards_covered = {}  # Track which yards were covered
-        for assignment_data in raw_assignments:
-            shifts_count[assignment_data["employee_id"]] += 1
-            key = (assignment_data["car_yard_id"], assignment_data["day"])
-            if key not in yards_covered:
-                yards_covered[key] = []
-            yards_covered[key].append(assignment_data["employee_id"])
-
         day_assignments: Dict[DayOfWeek, List[Tuple[int, List[int]]]] = {}
         for (cy_id, day), employee_ids in yards_covered.items():
             day_assignments.setdefault(day, []).append((cy_id, employee_ids))
 
-        hours_per_employee_day = {
-            f"emp_{emp_id}_day_{day.value}":
-            solver.Value(minutes_var) / SCALE_FACTOR
-            for (emp_id, day), minutes_var in employee_day_minutes.items()
-        }
-
         default_start = request.earliest_start_time or time(
             hour=DEFAULT_EARLIEST_START_HOUR, minute=DEFAULT_EARLIEST_START_MINUTE)
-
-        def add_minutes(base: time, minutes: float) -> time:
-            base_dt = datetime.combine(datetime.today(), base)
-            end_dt = base_dt + timedelta(minutes=minutes)
-            return end_dt.time()
+        # Timings are tracked as minutes since midnight and only formatted for
+        # the response
+        default_start_minutes = _time_to_minutes(default_start)
 
         yard_timeblocks = []
         travel_buffer = request.travel_buffer_minutes
-
-        priority_rank = {
-            CarYardPriority.HIGH: 0,
-            CarYardPriority.MEDIUM: 1,
-            CarYardPriority.LOW: 2,
-            # Default rank for unknown priorities (shouldn't happen, but safe fallback)
-        }
+        # Checked once so the per-yard debug formatting is skipped entirely
+        # unless debug logging is on
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         # Get actual work hours from solver for each employee at each yard
         # work_minutes stores integer minutes (scaled by SCALE_FACTOR=60)
         actual_work_hours: Dict[Tuple[int, int, DayOfWeek], float] = {}
-        for (emp_id, cy_id, day), work_var in work_minutes.items():
+        employee_day_minutes: Dict[Tuple[int, DayOfWeek], int] = {
+            (emp_id, day): 0 for emp_id in employees.keys() for day in days
+        }
+        # Work variables are pinned to 0 when unassigned, so only the assigned
+        # keys need their values read back
+        worked_keys = [key for key in assigned_keys if key in work_minutes]
+        worked_minutes = _solution_values(
+            solver, [work_minutes[key] for key in worked_keys])
+        for key, minutes in zip(worked_keys, worked_minutes):
+            emp_id, _, day = key
+            employee_day_minutes[(emp_id, day)] += minutes
             # Convert from minutes to hours
-            actual_work_hours[(emp_id, cy_id, day)] = solver.Value(
-                work_var) / SCALE_FACTOR
+            actual_work_hours[key] = minutes / SCALE_FACTOR
+        # Fixed-crew yards have no work variables: every assignee works the constant load
+        for (cy_id, day), employee_ids in yards_covered.items():
+            if cy_id not in fixed_crew_load:
+                continue
+            minutes = fixed_crew_load[cy_id]
+            for emp_id in employee_ids:
+                employee_day_minutes[(emp_id, day)] += minutes
+                actual_work_hours[(emp_id, cy_id, day)] = minutes / SCALE_FACTOR
+
+        hours_per_employee_day = {
+            f"emp_{emp_id}_day_{day.value}": minutes / SCALE_FACTOR
+            for (emp_id, day), minutes in employee_day_minutes.items()
+        }
 
         for day in days:
             if day not in day_assignments:
@@ -849,20 +1579,21 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
                 day_yards,
                 key=lambda item: (
                     car_yards[item[0]].startTime or default_start,
-                    priority_rank.get(car_yards[item[0]].priority,
+                    PRIORITY_RANK.get(car_yards[item[0]].priority,
                                       DEFAULT_PRIORITY_RANK),
                     item[0]
                 )
             )
-            availability: Dict[int, time] = {}
+            availability: Dict[int, float] = {}
 
             for cy_id, employee_ids in day_yards:
                 employee_count = len(employee_ids)
                 if employee_count == 0:
                     continue
                 cy = car_yards[cy_id]
-                earliest_allowed = cy.startTime or default_start
-                start_candidates = [availability.get(emp_id, default_start)
+                earliest_allowed = (_time_to_minutes(cy.startTime) if cy.startTime
+                                    else default_start_minutes)
+                start_candidates = [availability.get(emp_id, default_start_minutes)
                                     for emp_id in employee_ids]
                 proposed_start = max(
                     earliest_allowed, *start_candidates) if start_candidates else earliest_allowed
@@ -873,11 +1604,11 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
                     employee_count if employee_count > 0 else 0.0
 
                 # DEBUG: Log actual vs expected work distribution
-                solver_work_hours = [
-                    actual_work_hours.get((emp_id, cy_id, day), 0.0)
-                    for emp_id in employee_ids
-                ]
-                if solver_work_hours:
+                if debug_enabled:
+                    solver_work_hours = [
+                        actual_work_hours.get((emp_id, cy_id, day), 0.0)
+                        for emp_id in employee_ids
+                    ]
                     logger.debug(
                         f"Yard {cy_id} ({cy.name}) on {day.value}: "
                         f"{employee_count} employees, hours_required={cy.hours_required}, "
@@ -887,20 +1618,20 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
 
                 # Calculate finish time: all workers start together and finish together
                 # since they all work the same amount (hours_required / num_employees)
-                finish_time = add_minutes(
-                    proposed_start, per_employee_hours * MINUTES_PER_HOUR)
+                finish_time = (proposed_start + per_employee_hours *
+                               MINUTES_PER_HOUR) % MINUTES_PER_DAY
 
                 # Update availability for each employee (all finish at the same time)
                 for emp_id in employee_ids:
-                    availability[emp_id] = add_minutes(
-                        finish_time, travel_buffer)
+                    availability[emp_id] = (
+                        finish_time + travel_buffer) % MINUTES_PER_DAY
 
                 yard_timeblocks.append({
                     "car_yard_id": cy_id,
                     "car_yard_name": cy.name,
                     "day": day.value,
-                    "start_time": proposed_start.isoformat(timespec="minutes"),
-                    "finish_time": finish_time.isoformat(timespec="minutes"),
+                    "start_time": _minutes_to_iso(proposed_start),
+                    "finish_time": _minutes_to_iso(finish_time),
                     "employees": employee_ids,
                     "minutes_per_employee": per_employee_hours * MINUTES_PER_HOUR,
                     "per_employee_hours": per_employee_hours  # Store for reuse
@@ -909,12 +1640,7 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
         # Validate that no employee exceeds max_hours_per_day
         # Use the solver's actual work distribution for validation (not equal distribution)
         # The solver constraint should already enforce this, but we verify as a safety check
-        employee_total_hours_per_day: Dict[Tuple[int, DayOfWeek], float] = {}
-        for (emp_id, cy_id, day), work_hours in actual_work_hours.items():
-            if work_hours > 0:  # Only count actual work assignments
-                key = (emp_id, day)
-                employee_total_hours_per_day[key] = employee_total_hours_per_day.get(
-                    key, 0.0) + work_hours
+        # (per-day solver totals are already summed in employee_day_minutes)
 
         # Also validate using equal distribution calculation (for reporting/scheduling purposes)
         # This is what we use for finish times, so it should also respect max_hours_per_day
@@ -947,10 +1673,8 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
         for (emp_id, day), total_hours in employee_total_hours_equal_dist.items():
             if total_hours > request.max_hours_per_day + FLOATING_POINT_TOLERANCE:
                 # Log warning but don't fail - the solver constraint should handle this
-                solver_hours = employee_total_hours_per_day.get(
-                    (emp_id, day), 0.0)
-                emp_name = next(
-                    (emp.name for emp in request.employees if emp.id == emp_id), f"Employee {emp_id}")
+                solver_hours = employee_day_minutes[(emp_id, day)] / SCALE_FACTOR
+                emp_name = emp_names[emp_id]
                 logger.warning(
                     f"Employee {emp_name} would exceed max_hours_per_day ({request.max_hours_per_day}) "
                     f"on {day.value} with equal distribution ({total_hours:.2f}h), "
@@ -966,32 +1690,31 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
             yard_timing_map[key] = (block["start_time"], block["finish_time"])
 
         # Create Assignment objects with start and finish times
+        # Every field comes from the already-validated request or from values computed
+        # above, so the rows are built with model_construct to skip re-validation
         assignments = []
-        for assignment_data in raw_assignments:
-            timing_key = (
-                assignment_data["car_yard_id"], assignment_data["day"])
+        for emp_id, cy_id, day in assigned_keys:
             start_time, finish_time = yard_timing_map.get(
-                timing_key, ("", ""))
-            assignments.append(Assignment(
-                employee_id=assignment_data["employee_id"],
-                employee_name=assignment_data["employee_name"],
-                car_yard_id=assignment_data["car_yard_id"],
-                car_yard_name=assignment_data["car_yard_name"],
-                day=assignment_data["day"],
+                (cy_id, day), ("", ""))
+            assignments.append(Assignment.model_construct(
+                employee_id=emp_id,
+                employee_name=emp_names[emp_id],
+                car_yard_id=cy_id,
+                car_yard_name=car_yards[cy_id].name,
+                day=day,
                 start_time=start_time,
                 finish_time=finish_time
             ))
 
         # Build roster structure for frontend
-        employee_name_map = {emp.id: emp.name for emp in request.employees}
         roster_by_day: Dict[DayOfWeek, List[YardSchedule]] = {}
 
         for block in yard_timeblocks:
             day = DayOfWeek(block["day"])
-            worker_names = [employee_name_map[emp_id]
+            worker_names = [emp_names[emp_id]
                             for emp_id in block["employees"]]
 
-            yard_schedule = YardSchedule(
+            yard_schedule = YardSchedule.model_construct(
                 car_yard_id=block["car_yard_id"],
                 car_yard_name=block["car_yard_name"],
                 workers=worker_names,
@@ -999,9 +1722,7 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
                 finish_time=block["finish_time"]
             )
 
-            if day not in roster_by_day:
-                roster_by_day[day] = []
-            roster_by_day[day].append(yard_schedule)
+            roster_by_day.setdefault(day, []).append(yard_schedule)
 
         # Build DayRoster for each day in the request (even if empty)
         day_rosters = []
@@ -1015,15 +1736,20 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
             status="optimal" if status == cp_model.OPTIMAL else "feasible",
             assignments=assignments,
             roster=roster_structure,
-            stats={
-                "total_assignments": len(assignments),
-                "shifts_per_employee": shifts_count,
-                "yards_covered": {f"yard_{cy_id}_day_{day.value}": len(employee_ids)
-                                  for (cy_id, day), employee_ids in yards_covered.items()},
-                "hours_per_employee_day": hours_per_employee_day,
-                "yard_timeblocks": yard_timeblocks,
-                "solve_time_seconds": solver.WallTime()
-            }
+            stats=ScheduleStats(
+                total_assignments=len(assignments),
+                shifts_per_employee=shifts_count,
+                yards_covered={f"yard_{cy_id}_day_{day.value}": len(employee_ids)
+                               for (cy_id, day), employee_ids in yards_covered.items()},
+                hours_per_employee_day=hours_per_employee_day,
+                yard_timeblocks=yard_timeblocks,
+                solve_time_seconds=solve_time_seconds
+            )
+        )
+    elif status == cp_model.MODEL_INVALID:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid solver parameters: CP-SAT rejected the solver configuration"
         )
     else:
         raise HTTPException(
@@ -1032,12 +1758,28 @@ def solve_roster(request: ScheduleRequest) -> ScheduleResponse:
         )
 
 
+@lru_cache(maxsize=ROSTER_CACHE_SIZE)
+def _solve_roster_cached(request_json: str) -> Dict[str, Any]:
+    """
+    Solve a serialized request, memoizing the dumped response so repeated
+    identical requests skip both model building and solving.
+
+    Failures raise HTTPException and are therefore never cached.
+    """
+    request = ScheduleRequest.model_validate_json(request_json)
+    # Cache hits never get here, so they never wait for a solve slot
+    with _solve_slots:
+        return solve_roster(request).model_dump()
+
+
 @api.post("/api/v1/roster", response_model=ScheduleResponse)
 async def generate_roster(request: ScheduleRequest):
     """
     Generate an optimal roster for car yard cleaning
     """
-    return solve_roster(request)
+    # Solve in FastAPI's worker thread pool so a long CP-SAT run doesn't block the
+    # event loop; concurrent solves are bounded by CONCURRENT_SOLVES
+    return await run_in_threadpool(_solve_roster_cached, request.model_dump_json())
 
 
 @api.get("/")
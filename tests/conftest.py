@@ -1,11 +1,38 @@
 
 # Fixtures for reusable test data
+import os
 from datetime import date, time
-from src.scheduler.rostering_api import CarYard, CarYardPriority, CarYardRegion, DayOfWeek, Employee, EmployeeReliabilityRating
+
+# Under pytest-xdist (pytest -n N) every worker process solves in parallel, so
+# give each one its share of the cores, as uvicorn workers get in production.
+# Must be set before the API module reads it at import time
+os.environ.setdefault("ROSTER_API_WORKERS", os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+from fastapi.testclient import TestClient
+from src.scheduler.rostering_api import api, solve_roster, CarYard, CarYardPriority, CarYardRegion, DayOfWeek, Employee, EmployeeReliabilityRating, ScheduleRequest
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole run, with OR-Tools loaded and warmed up once"""
+    with TestClient(api) as test_client:
+        # A trivial solve pays the CP-SAT native library cold start up front so
+        # it isn't charged to whichever test happens to run first
+        solve_roster(ScheduleRequest(
+            employees=[Employee(id=1, name="Warm Up", ranking=EmployeeReliabilityRating.EXCELLENT,
+                                available_days=[DayOfWeek.MONDAY])],
+            car_yards=[CarYard(id=1, name="Warm Up Yard", priority=CarYardPriority.HIGH,
+                               region=CarYardRegion.CENTRAL, min_employees=1, max_employees=1)],
+            days=[DayOfWeek.MONDAY],
+            num_search_workers=1
+        ))
+        yield test_client
+
+
+# The sample data is built and validated once per session; the models are frozen
+# and tests only read (or slice) the lists
+@pytest.fixture(scope="session")
 def sample_employees():
     return [
         Employee(
@@ -54,7 +81,7 @@ def sample_employees():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_car_yards():
     return [
         CarYard(id=1, name="Adrien Brian", priority=CarYardPriority.HIGH,
@@ -81,6 +108,16 @@ def sample_car_yards():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_days():
     return [DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY, DayOfWeek.THURSDAY, DayOfWeek.FRIDAY, DayOfWeek.SATURDAY]
+
+
+@pytest.fixture(scope="session")
+def sample_request(sample_employees, sample_car_yards, sample_days):
+    """The sample data as a ready-built request; derive variants with model_copy"""
+    return ScheduleRequest(
+        employees=sample_employees,
+        car_yards=sample_car_yards,
+        days=sample_days
+    )
@@ -1,8 +1,6 @@
 # test_rostering_api.py
-# import pytest
-from fastapi.testclient import TestClient
+import pytest
 from src.scheduler.rostering_api import (
-    api,
     DayOfWeek,
     Employee,
     CarYard,
@@ -11,54 +9,103 @@ from src.scheduler.rostering_api import (
     CarYardRegion,
     EmployeeReliabilityRating,
     solve_roster,
+    _solve_roster_cached,
+    _build_roster_model_cached,
+    MAX_SOLVER_TIMEOUT_SECONDS,
 )
-from datetime import datetime, time, timedelta
+from datetime import time
+from collections import Counter
+from itertools import groupby
 from typing import Dict
+import orjson
+import os
 from src.scheduler.utils import print_json
 
-client = TestClient(api)
-
-DEBUG = True
+# Set ROSTER_TEST_DEBUG=1 (and run pytest -s) to print responses and schedules
+DEBUG = os.getenv("ROSTER_TEST_DEBUG") == "1"
+BAR_60 = "=" * 60
+BAR_80 = "=" * 80
+RULE_80 = "─" * 80
 
 
 def check_and_print_response(response, title="API Response"):
     """Helper to print response whether success or error"""
     if DEBUG:
-        print(f"\n{'='*60}")
+        print(f"\n{BAR_60}")
         print(f"📡 {title}")
-        print('='*60)
+        print(BAR_60)
         print(f"Status Code: {response.status_code}")
         try:
-            print_json(response.json(), "Response Body")
+            print_json(_loads(response), "Response Body")
         except:
             print(f"Response Text: {response.text}")
-        print('='*60 + "\n")
+        print(BAR_60 + "\n")
     return response
 
 
+def _mins(hh_mm):
+    """Minutes since midnight for an "HH:MM" response time"""
+    hours, minutes = hh_mm.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _loads(response):
+    """Parse a response body with orjson (the API encodes with orjson too)"""
+    return orjson.loads(response.content)
+
+
+def _post_roster(client, request):
+    """POST a request to the roster endpoint, serialized once straight to JSON"""
+    return client.post("/api/v1/roster", content=request.model_dump_json(),
+                       headers={"Content-Type": "application/json"})
+
+
+def _single_yard_request(**settings):
+    """One employee and one single-crew yard on Monday, with the given request fields set"""
+    return ScheduleRequest(
+        employees=[
+            Employee(id=1, name="Solo", ranking=EmployeeReliabilityRating.EXCELLENT,
+                     available_days=[DayOfWeek.MONDAY])
+        ],
+        car_yards=[
+            CarYard(id=1, name="Yard A", priority=CarYardPriority.HIGH,
+                    min_employees=1, max_employees=1, region=CarYardRegion.CENTRAL)
+        ],
+        days=[DayOfWeek.MONDAY],
+        **settings
+    )
+
+
+def _assert_daily_hours_within(hours_per_employee_day, limit):
+    """Assert no employee-day in the stats exceeds limit hours, naming the worst one"""
+    worst = max(hours_per_employee_day, key=hours_per_employee_day.get)
+    hours = hours_per_employee_day[worst]
+    assert hours <= limit + 1e-6, f"{worst} exceeds {limit} hours: {hours:.2f} hours"
+
+
+def _solve(request):
+    """Solve in-process and return the response in its JSON shape, skipping HTTP"""
+    return solve_roster(request).model_dump(mode="json")
+
+
 # Test cases
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test the root endpoint returns correct info"""
     response = client.get("/")
     assert response.status_code == 200
-    data = response.json()
+    data = _loads(response)
     assert "message" in data
     assert "docs" in data
 
 
-def test_basic_roster_generation(sample_employees, sample_car_yards, sample_days):
+def test_basic_roster_generation(client, sample_request, sample_car_yards, sample_days):
     """Test a basic valid roster request"""
-    request = ScheduleRequest(
-        employees=sample_employees,
-        car_yards=sample_car_yards,
-        days=sample_days
-    )
-
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    # Only the roster's validity is checked, so a short budget is enough
+    response = _post_roster(
+        client, sample_request.model_copy(update={"time_limit_seconds": 2.0}))
     assert response.status_code == 200
 
-    data = response.json()
+    data = _loads(response)
     assert data["status"] in ["optimal", "feasible"]
     assert "assignments" in data
     assert "stats" in data
@@ -68,24 +115,20 @@ def test_basic_roster_generation(sample_employees, sample_car_yards, sample_days
     assert len(assignments) > 0
 
     # Check constraints: each yard should have min-max employees per day (if assigned)
-    assignments_by_day_yard = {}
-    for assignment in assignments:
-        key = (assignment["day"], assignment["car_yard_id"])
-        if key not in assignments_by_day_yard:
-            assignments_by_day_yard[key] = 0
-        assignments_by_day_yard[key] += 1
+    assignments_by_day_yard = Counter(
+        (assignment["day"], assignment["car_yard_id"]) for assignment in assignments)
 
     # Note: With priority-based system, yards may not be covered every day
     # Only check yards that actually have assignments
     for cy in sample_car_yards:
         for day in sample_days:
-            count = assignments_by_day_yard.get((day.value, cy.id), 0)
+            count = assignments_by_day_yard[(day.value, cy.id)]
             # If yard is covered on this day, it must have min-max employees
             if count > 0:
                 assert cy.min_employees <= count <= cy.max_employees
 
 
-def test_employee_availability_constraint(sample_employees, sample_car_yards):
+def test_employee_availability_constraint(client, sample_employees, sample_car_yards):
     """Test that employees are only assigned on their available days"""
     # Create an employee who can only work Monday
     limited_employee = Employee(
@@ -104,15 +147,14 @@ def test_employee_availability_constraint(sample_employees, sample_car_yards):
         days=[DayOfWeek.MONDAY, DayOfWeek.TUESDAY]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     check_and_print_response(response, "Employee Availability Constraint")
 
     # With strict weekly coverage, this scenario is infeasible
     assert response.status_code == 400
 
 
-def test_impossible_constraint():
+def test_impossible_constraint(client):
     """Test that impossible scenarios return an error"""
     # Try to schedule with no employees available
     # With priority-based system, this will return a solution with no assignments
@@ -133,8 +175,7 @@ def test_impossible_constraint():
         days=[DayOfWeek.TUESDAY]  # Need Tuesday but no one available
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
 
     # Weekly coverage requirement makes this infeasible
     assert response.status_code == 400
@@ -166,11 +207,7 @@ def test_ranking_preference():
         days=[DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
-    assert response.status_code == 200
-
-    data = response.json()
+    data = _solve(request)
     shifts_count = data["stats"]["shifts_per_employee"]
 
     # Employee 1 (EXCELLENT rating=10) should get more or equal shifts than employee 2 (BELOW_AVERAGE rating=5)
@@ -195,11 +232,7 @@ def test_one_employee_one_yard():
         days=[DayOfWeek.MONDAY]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
-    assert response.status_code == 200
-
-    data = response.json()
+    data = _solve(request)
     assert len(data["assignments"]) == 1
     assert data["assignments"][0]["employee_id"] == 1
     assert data["assignments"][0]["car_yard_id"] == 1
@@ -229,11 +262,7 @@ def test_workload_balance():
         days=[DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
-    assert response.status_code == 200
-
-    data = response.json()
+    data = _solve(request)
     shifts_count = data["stats"]["shifts_per_employee"]
 
     # Check that workload is reasonably balanced
@@ -253,7 +282,7 @@ def test_realistic_roster():
     pass
 
 
-def test_priority_based_assignment():
+def test_priority_based_assignment(client):
     """Test that high-priority car yards are prioritized when employees are limited"""
     employees = [
         Employee(
@@ -287,13 +316,12 @@ def test_priority_based_assignment():
         days=[DayOfWeek.MONDAY, DayOfWeek.TUESDAY]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     check_and_print_response(response, "Priority-Based Assignment")
 
     assert response.status_code == 200
 
-    data = response.json()
+    data = _loads(response)
     assignments = data["assignments"]
 
     # Group assignments by yard and day
@@ -326,134 +354,94 @@ def test_priority_based_assignment():
         print(f"  Low Priority Yard: {low_priority_days} days covered")
 
 
-def test_hours_constraint():
-    """Test that employees cannot exceed max_hours_per_day limit"""
-    # Create yards with different hour requirements
-    # Yard 1: 2 hours, Yard 2: 1.5 hours, Yard 3: 2.5 hours
-    # Total: 6 hours (exceeds 5 hour limit)
-    car_yards = [
-        CarYard(id=1, name="Yard A", priority=CarYardPriority.HIGH,
-                min_employees=1, max_employees=2, hours_required=2.0, region=CarYardRegion.CENTRAL),
-        CarYard(id=2, name="Yard B", priority=CarYardPriority.HIGH,
-                min_employees=1, max_employees=2, hours_required=1.5, region=CarYardRegion.CENTRAL),
-        CarYard(id=3, name="Yard C", priority=CarYardPriority.HIGH,
-                min_employees=1, max_employees=2, hours_required=2.5, region=CarYardRegion.CENTRAL),
-    ]
-
+def test_uneven_fixed_crew_split_uses_last_minute():
+    """A fixed crew's rounding minute goes to whoever still has time left that day"""
     employees = [
-        Employee(
-            id=1,
-            name="Employee 1",
-            ranking=EmployeeReliabilityRating.EXCELLENT,
-            available_days=[DayOfWeek.MONDAY]
-        ),
-        Employee(
-            id=2,
-            name="Employee 2",
-            ranking=EmployeeReliabilityRating.EXCELLENT,
-            available_days=[DayOfWeek.MONDAY]
-        )
+        Employee(id=i, name=f"Employee {i}", ranking=EmployeeReliabilityRating.EXCELLENT,
+                 available_days=[DayOfWeek.MONDAY])
+        for i in (1, 2)
     ]
-
-    # Set max_hours_per_day to 5.0
-    request = ScheduleRequest(
-        employees=employees,
-        car_yards=car_yards,
-        days=[DayOfWeek.MONDAY],
-        max_hours_per_day=5.0
-    )
-
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
-    check_and_print_response(response, "Hours Constraint Test")
-
-    assert response.status_code == 200
-    data = response.json()
-    assigned = {assignment["employee_id"]
-                for assignment in data["assignments"]}
-    assert assigned == {1, 2}
-
-    hours_stats = data["stats"]["hours_per_employee_day"]
-    for key, hours in hours_stats.items():
-        assert hours <= 5.0 + 1e-6, f"{key} exceeds 5.0 hours: {hours}"
-
-
-def test_hours_constraint_multiple_yards_allowed():
-    """Test that employees CAN work multiple yards if they fit within hours limit"""
-    # Create yards that can fit together: 2.0 + 1.5 = 3.5 hours (within 5 hour limit)
+    # 181 minutes split across a crew of two is 90 + 91; whoever also works the
+    # 90-minute yard must get the 90 to stay within the 3 hour limit
     car_yards = [
-        CarYard(id=1, name="Yard A", priority=CarYardPriority.HIGH,
-                min_employees=1, max_employees=2, hours_required=2.0, region=CarYardRegion.CENTRAL),
-        CarYard(id=2, name="Yard B", priority=CarYardPriority.MEDIUM,
-                min_employees=1, max_employees=2, hours_required=1.5, region=CarYardRegion.CENTRAL),
+        CarYard(id=1, name="Uneven Crew", priority=CarYardPriority.HIGH,
+                min_employees=2, max_employees=2, hours_required=181 / 60,
+                region=CarYardRegion.CENTRAL),
+        CarYard(id=2, name="Solo", priority=CarYardPriority.HIGH,
+                min_employees=1, max_employees=1, hours_required=1.5,
+                region=CarYardRegion.CENTRAL),
     ]
-
-    employees = [
-        Employee(
-            id=1,
-            name="Employee 1",
-            ranking=EmployeeReliabilityRating.EXCELLENT,
-            available_days=[DayOfWeek.MONDAY, DayOfWeek.TUESDAY]
-        )
-    ]
-
-    request = ScheduleRequest(
-        employees=employees,
-        car_yards=car_yards,
-        days=[DayOfWeek.MONDAY, DayOfWeek.TUESDAY],
-        max_hours_per_day=5.0
-    )
-
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
-    assert response.status_code == 200
-    data = response.json()
-
-    hours_stats = data["stats"]["hours_per_employee_day"]
-    for key, hours in hours_stats.items():
-        assert hours <= 5.0 + 1e-6, f"{key} exceeds limit: {hours}"
-
-
-def test_hours_constraint_with_default():
-    """Test that default max_hours_per_day=5.0 works correctly"""
-    # Create yards with varying hours
+    request = ScheduleRequest(employees=employees, car_yards=car_yards,
+                              days=[DayOfWeek.MONDAY], max_hours_per_day=3.0,
+                              travel_buffer_minutes=0)
+
+    data = _solve(request)
+    assert {a["car_yard_id"] for a in data["assignments"]} == {1, 2}
+    _assert_daily_hours_within(data["stats"]["hours_per_employee_day"], 3.0)
+
+
+@pytest.mark.parametrize(
+    "yards,employee_count,days,max_hours_per_day,limit",
+    [
+        # Yard 1: 2 hours, Yard 2: 1.5 hours, Yard 3: 2.5 hours
+        # Total: 6 hours (exceeds 5 hour limit), so both employees are needed
+        pytest.param(
+            [(2.0, CarYardPriority.HIGH), (1.5, CarYardPriority.HIGH),
+             (2.5, CarYardPriority.HIGH)],
+            2, [DayOfWeek.MONDAY], 5.0, 5.0, id="split_over_limit"),
+        # Yards that fit together: 2.0 + 1.5 = 3.5 hours (within 5 hour limit),
+        # so one employee CAN work multiple yards
+        pytest.param(
+            [(2.0, CarYardPriority.HIGH), (1.5, CarYardPriority.MEDIUM)],
+            1, [DayOfWeek.MONDAY, DayOfWeek.TUESDAY], 5.0, 5.0,
+            id="multiple_yards_allowed"),
+        # max_hours_per_day not specified: the default (7.0) applies
+        pytest.param(
+            [(2.0, CarYardPriority.HIGH), (2.0, CarYardPriority.HIGH),
+             (2.0, CarYardPriority.HIGH)],
+            1, [DayOfWeek.MONDAY], None, 7.0, id="default_limit"),
+    ],
+)
+def test_hours_constraint(yards, employee_count, days, max_hours_per_day, limit):
+    """Test that employees never exceed the max_hours_per_day limit"""
     car_yards = [
-        CarYard(id=1, name="Yard A", priority=CarYardPriority.HIGH,
-                min_employees=1, max_employees=2, hours_required=2.0, region=CarYardRegion.CENTRAL),
-        CarYard(id=2, name="Yard B", priority=CarYardPriority.HIGH,
-                min_employees=1, max_employees=2, hours_required=2.0, region=CarYardRegion.CENTRAL),
-        CarYard(id=3, name="Yard C", priority=CarYardPriority.HIGH,
-                min_employees=1, max_employees=2, hours_required=2.0, region=CarYardRegion.CENTRAL),
+        CarYard(id=i, name=f"Yard {chr(ord('A') + i - 1)}", priority=priority,
+                min_employees=1, max_employees=2, hours_required=hours, region=CarYardRegion.CENTRAL)
+        for i, (hours, priority) in enumerate(yards, start=1)
     ]
 
     employees = [
         Employee(
-            id=1,
-            name="Employee 1",
+            id=i,
+            name=f"Employee {i}",
             ranking=EmployeeReliabilityRating.EXCELLENT,
-            available_days=[DayOfWeek.MONDAY]
+            available_days=days
         )
+        for i in range(1, employee_count + 1)
     ]
 
-    # Don't specify max_hours_per_day - should default to 5.0
+    optional = {} if max_hours_per_day is None else {
+        "max_hours_per_day": max_hours_per_day}
     request = ScheduleRequest(
         employees=employees,
         car_yards=car_yards,
-        days=[DayOfWeek.MONDAY]
+        days=days,
+        **optional
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
-    assert response.status_code == 200
-    data = response.json()
+    data = _solve(request)
+    if DEBUG:
+        print_json(data, "Hours Constraint Test")
+    if employee_count > 1:
+        # The work can't fit one employee's day, so it must be shared
+        assigned = {assignment["employee_id"]
+                    for assignment in data["assignments"]}
+        assert assigned == {emp.id for emp in employees}
 
-    # Verify default max_hours_per_day (7.0) is enforced
-    hours_stats = data["stats"]["hours_per_employee_day"]
-    for key, hours in hours_stats.items():
-        assert hours <= 7.0 + 1e-6, f"{key} exceeds default 7.0 hours: {hours}"
+    _assert_daily_hours_within(data["stats"]["hours_per_employee_day"], limit)
 
 
-def test_start_times_respect_yard_overrides_and_buffer():
+def test_start_times_respect_yard_overrides_and_buffer(client):
     employees = [
         Employee(
             id=1,
@@ -492,10 +480,9 @@ def test_start_times_respect_yard_overrides_and_buffer():
         travel_buffer_minutes=30
     )
 
-    response = client.post("/api/v1/roster",
-                           json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 200
-    data = response.json()
+    data = _loads(response)
 
     timeblocks = {
         block["car_yard_id"]: block
@@ -514,14 +501,11 @@ def test_start_times_respect_yard_overrides_and_buffer():
         "Late yard should respect its specific startTime override"
     assert late_block["finish_time"] == "09:30"
 
-    early_finish = datetime.strptime(
-        early_block["finish_time"], "%H:%M")
-    late_start = datetime.strptime(
-        late_block["start_time"], "%H:%M")
-    assert late_start - early_finish >= timedelta(minutes=30)
+    assert _mins(late_block["start_time"]) - \
+        _mins(early_block["finish_time"]) >= 30
 
 
-def test_travel_buffer_enforced_between_consecutive_yards():
+def test_travel_buffer_enforced_between_consecutive_yards(client):
     employees = [
         Employee(
             id=1,
@@ -560,10 +544,9 @@ def test_travel_buffer_enforced_between_consecutive_yards():
         travel_buffer_minutes=travel_buffer
     )
 
-    response = client.post("/api/v1/roster",
-                           json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 200
-    data = response.json()
+    data = _loads(response)
 
     timeblocks = {
         block["car_yard_id"]: block
@@ -574,18 +557,18 @@ def test_travel_buffer_enforced_between_consecutive_yards():
     first_block = timeblocks[1]
     second_block = timeblocks[2]
 
-    first_start = datetime.strptime(first_block["start_time"], "%H:%M")
-    first_finish = datetime.strptime(first_block["finish_time"], "%H:%M")
-    second_start = datetime.strptime(second_block["start_time"], "%H:%M")
+    first_start = _mins(first_block["start_time"])
+    first_finish = _mins(first_block["finish_time"])
+    second_start = _mins(second_block["start_time"])
 
-    assert first_start.time() == time(6, 0)
-    assert first_finish - first_start == timedelta(hours=1)
-    assert second_start - first_finish >= timedelta(minutes=travel_buffer)
-    assert second_start.time() == time(7, 45), \
+    assert first_start == 6 * 60
+    assert first_finish - first_start == 60
+    assert second_start - first_finish >= travel_buffer
+    assert second_start == 7 * 60 + 45, \
         "Second yard should start after work duration plus travel buffer"
 
 
-def test_crews_stay_intact_between_consecutive_yards():
+def test_crews_stay_intact_between_consecutive_yards(client):
     employees = [
         Employee(
             id=1,
@@ -636,10 +619,9 @@ def test_crews_stay_intact_between_consecutive_yards():
         travel_buffer_minutes=30
     )
 
-    response = client.post("/api/v1/roster",
-                           json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 200
-    data = response.json()
+    data = _loads(response)
     timeblocks = sorted(
         data["stats"]["yard_timeblocks"],
         key=lambda block: block["start_time"]
@@ -655,7 +637,7 @@ def test_crews_stay_intact_between_consecutive_yards():
             "If a crew carries over to the next yard, no new employees should join mid-day."
 
 
-def test_realistic_schedule_readable_format(sample_employees, sample_car_yards, sample_days):
+def test_realistic_schedule_readable_format(client, sample_employees, sample_car_yards, sample_days):
     """
     Test a realistic schedule scenario with readable output format.
     Output structure: array of days, each day contains car yards, each car yard contains assigned employees.
@@ -679,21 +661,20 @@ def test_realistic_schedule_readable_format(sample_employees, sample_car_yards,
         max_hours_per_day=5.0
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
 
     # Check if we got an error and print details
     if response.status_code != 200:
         print(f"\n❌ Error Response ({response.status_code}):")
         try:
-            error_data = response.json()
+            error_data = _loads(response)
             print_json(error_data, "Error Details")
         except:
             print(f"Response text: {response.text}")
 
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-    data = response.json()
+    data = _loads(response)
     assert data["status"] in ["optimal", "feasible"]
     assert "assignments" in data
 
@@ -710,24 +691,22 @@ def test_realistic_schedule_readable_format(sample_employees, sample_car_yards,
             "car_yards": {}
         }
 
-    # Populate schedule with assignments
-    for assignment in data["assignments"]:
-        day = assignment["day"]
-        cy_id = assignment["car_yard_id"]
-        emp_id = assignment["employee_id"]
-
-        if cy_id not in schedule[day]["car_yards"]:
-            schedule[day]["car_yards"][cy_id] = {
-                "yard_id": cy_id,
-                "yard_name": yard_map[cy_id]["name"],
-                "hours_required": yard_map[cy_id]["hours"],
-                "employees": []
-            }
-
-        schedule[day]["car_yards"][cy_id]["employees"].append({
-            "employee_id": emp_id,
-            "employee_name": employee_map[emp_id]
-        })
+    # Populate schedule with assignments, grouped by (day, yard) in one pass
+    def day_and_yard(assignment):
+        return assignment["day"], assignment["car_yard_id"]
+
+    for (day, cy_id), crew in groupby(
+            sorted(data["assignments"], key=day_and_yard), key=day_and_yard):
+        schedule[day]["car_yards"][cy_id] = {
+            "yard_id": cy_id,
+            "yard_name": yard_map[cy_id]["name"],
+            "hours_required": yard_map[cy_id]["hours"],
+            "employees": [
+                {"employee_id": assignment["employee_id"],
+                 "employee_name": employee_map[assignment["employee_id"]]}
+                for assignment in crew
+            ]
+        }
 
     # Convert to list format for cleaner output
     schedule_list = []
@@ -739,20 +718,14 @@ def test_realistic_schedule_readable_format(sample_employees, sample_car_yards,
         schedule_list.append(day_data)
 
     # Verify hours constraint using solver statistics
-    hours_stats = data["stats"]["hours_per_employee_day"]
-    employee_hours_per_day = {
-        key: hours for key, hours in hours_stats.items()
-    }
-
-    for key, total_hours in employee_hours_per_day.items():
-        assert total_hours <= 5.0 + 1e-6, \
-            f"{key} exceeds 5.0 hours: {total_hours:.2f} hours"
+    employee_hours_per_day = data["stats"]["hours_per_employee_day"]
+    _assert_daily_hours_within(employee_hours_per_day, 5.0)
 
     # Print readable schedule
     if DEBUG:
-        print("\n" + "="*80)
+        print("\n" + BAR_80)
         print("📅 REALISTIC SCHEDULE - READABLE FORMAT")
-        print("="*80)
+        print(BAR_80)
 
         yard_timeblocks = data["stats"].get("yard_timeblocks", [])
         timeblock_lookup = {
@@ -760,9 +733,9 @@ def test_realistic_schedule_readable_format(sample_employees, sample_car_yards,
         }
 
         for day_schedule in schedule_list:
-            print(f"\n{'─'*80}")
+            print(f"\n{RULE_80}")
             print(f"📆 {day_schedule['day'].upper()}")
-            print(f"{'─'*80}")
+            print(f"{RULE_80}")
 
             if not day_schedule["car_yards"]:
                 print("  No assignments")
@@ -792,9 +765,9 @@ def test_realistic_schedule_readable_format(sample_employees, sample_car_yards,
             print(
                 f"\n  📊 Total yard-hours for {day_schedule['day']}: {total_day_hours:.1f}h")
 
-        print(f"\n{'─'*80}")
+        print(f"\n{RULE_80}")
         print("📈 SUMMARY STATISTICS")
-        print(f"{'─'*80}")
+        print(f"{RULE_80}")
 
         # Employee workload summary
         employee_total_hours: Dict[int, float] = {}
@@ -814,7 +787,7 @@ def test_realistic_schedule_readable_format(sample_employees, sample_car_yards,
             print(
                 f"  {employee_name}: {total_hours:.1f} hours across {days_worked} days")
 
-        print("\n" + "="*80)
+        print("\n" + BAR_80)
 
         # Also print JSON format for programmatic access
         print_json(schedule_list, "Schedule (JSON Format)")
@@ -832,12 +805,20 @@ def test_realistic_schedule_readable_format(sample_employees, sample_car_yards,
     assert len(schedule_list) == len(
         sample_days), "Schedule should have entries for all days"
 
-    # Verify every yard is covered exactly once
-    all_yard_ids = {cy.id for cy in sample_car_yards}
-    covered_yard_ids = set()
+    # Collect each yard's visit days in one pass; the coverage checks below
+    # are all derived from it
+    day_index = {day.value: idx for idx, day in enumerate(sample_days)}
+    yard_visit_days: Dict[int, list] = {}
     for day_schedule in schedule_list:
         for yard in day_schedule["car_yards"]:
-            covered_yard_ids.add(yard["yard_id"])
+            yard_visit_days.setdefault(yard["yard_id"], []).append(
+                day_index[day_schedule["day"]])
+    coverage_by_yard = {yard_id: len(visits)
+                        for yard_id, visits in yard_visit_days.items()}
+
+    # Verify every yard is covered exactly once
+    all_yard_ids = {cy.id for cy in sample_car_yards}
+    covered_yard_ids = set(yard_visit_days)
 
     assert covered_yard_ids == all_yard_ids, \
         f"All yards must be covered exactly once. Missing: {all_yard_ids - covered_yard_ids}, Extra: {covered_yard_ids - all_yard_ids}"
@@ -845,26 +826,12 @@ def test_realistic_schedule_readable_format(sample_employees, sample_car_yards,
     # Check that high-priority yards are covered
     high_priority_yards = {
         cy.id for cy in sample_car_yards if cy.priority.value == "high"}
-    covered_high_priority = set()
-    for day_schedule in schedule_list:
-        for yard in day_schedule["car_yards"]:
-            if yard["yard_id"] in high_priority_yards:
-                covered_high_priority.add(yard["yard_id"])
+    covered_high_priority = covered_yard_ids & high_priority_yards
 
     # All high-priority yards should be covered exactly once
     assert len(covered_high_priority) == len(high_priority_yards), \
         f"All high-priority yards should be covered. Expected {len(high_priority_yards)}, got {len(covered_high_priority)}"
 
-    coverage_by_yard: Dict[int, int] = {cy.id: 0 for cy in sample_car_yards}
-    day_index = {day.value: idx for idx, day in enumerate(sample_days)}
-    yard_visit_days: Dict[int, list] = {cy.id: [] for cy in sample_car_yards}
-
-    for day_schedule in schedule_list:
-        for yard in day_schedule["car_yards"]:
-            yard_id = yard["yard_id"]
-            coverage_by_yard[yard_id] += 1
-            yard_visit_days[yard_id].append(day_index[day_schedule["day"]])
-
     assert coverage_by_yard[4] == 2, "Eblen Suburu should be scheduled twice per week"
     assert coverage_by_yard[5] == 1, "Reynella Kia should be scheduled once per week"
     assert coverage_by_yard[6] == 1, "Reynella All should be scheduled once per week"
@@ -884,7 +851,7 @@ def test_realistic_schedule_readable_format(sample_employees, sample_car_yards,
     return schedule_list
 
 
-def test_region_exclusion():
+def test_region_exclusion(client):
     employees = [
         Employee(
             id=1,
@@ -914,17 +881,16 @@ def test_region_exclusion():
         max_hours_per_day=5.0
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 200
-    data = response.json()
+    data = _loads(response)
     assigned = {assignment["employee_id"]
                 for assignment in data["assignments"]}
     assert 1 not in assigned
     assert 2 in assigned
 
 
-def test_required_days_constraint():
+def test_required_days_constraint(client):
     employees = [
         Employee(
             id=1,
@@ -954,15 +920,14 @@ def test_required_days_constraint():
         max_hours_per_day=6.0
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 200
-    data = response.json()
+    data = _loads(response)
     assignment_days = {assignment["day"] for assignment in data["assignments"]}
     assert assignment_days == {DayOfWeek.THURSDAY.value}
 
 
-def test_per_week_gap_constraint():
+def test_per_week_gap_constraint(client):
     employees = [
         Employee(
             id=1,
@@ -1001,10 +966,9 @@ def test_per_week_gap_constraint():
         max_hours_per_day=6.0
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 200
-    data = response.json()
+    data = _loads(response)
     yard_days = sorted(
         day_index[assignment["day"]]
         for assignment in data["assignments"]
@@ -1015,7 +979,7 @@ def test_per_week_gap_constraint():
     assert yard_days[1] - yard_days[0] >= 2
 
 
-def test_linked_yard_gap_constraint():
+def test_linked_yard_gap_constraint(client):
     employees = [
         Employee(
             id=1,
@@ -1063,10 +1027,9 @@ def test_linked_yard_gap_constraint():
         max_hours_per_day=7.0
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 200
-    data = response.json()
+    data = _loads(response)
 
     primary_days = [
         day_index[assignment["day"]]
@@ -1088,7 +1051,7 @@ def test_linked_yard_gap_constraint():
                    gap for linked_day in linked_days)
 
 
-def test_multiple_workers_divide_hours_equally():
+def test_multiple_workers_divide_hours_equally(client):
     """
     Test that when multiple workers are assigned to a yard, 
     each worker works hours_required / num_workers.
@@ -1136,11 +1099,10 @@ def test_multiple_workers_divide_hours_equally():
         max_hours_per_day=7.0
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 200
 
-    data = response.json()
+    data = _loads(response)
 
     # Find the yard timeblock
     yard_timeblocks = data["stats"]["yard_timeblocks"]
@@ -1161,14 +1123,8 @@ def test_multiple_workers_divide_hours_equally():
         f"Expected ~{expected_minutes_per_employee:.1f} minutes per employee, got {actual_minutes:.1f}"
 
     # Verify finish time calculation
-    from datetime import datetime, timedelta
-    start_time = datetime.strptime(yard_block["start_time"], "%H:%M").time()
-    finish_time = datetime.strptime(yard_block["finish_time"], "%H:%M").time()
-
-    start_dt = datetime.combine(datetime.today(), start_time)
-    finish_dt = datetime.combine(datetime.today(), finish_time)
-    duration = (finish_dt - start_dt).total_seconds() / \
-        3600.0  # Convert to hours
+    duration = (_mins(yard_block["finish_time"]) -
+                _mins(yard_block["start_time"])) / 60.0  # Convert to hours
 
     expected_duration = 8.0 / 3.0  # 2.67 hours
     assert abs(duration - expected_duration) < 0.1, \
@@ -1190,7 +1146,7 @@ def test_multiple_workers_divide_hours_equally():
             f"   Minutes per employee: {actual_minutes:.1f} (expected: {expected_minutes_per_employee:.1f})")
 
 
-def test_duplicate_employee_ids():
+def test_duplicate_employee_ids(client):
     """Test that duplicate employee IDs are rejected"""
     employees = [
         Employee(
@@ -1216,13 +1172,12 @@ def test_duplicate_employee_ids():
         days=[DayOfWeek.MONDAY]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 400
-    assert "duplicate employee" in response.json()["detail"].lower()
+    assert "duplicate employee" in _loads(response)["detail"].lower()
 
 
-def test_duplicate_car_yard_ids():
+def test_duplicate_car_yard_ids(client):
     """Test that duplicate car yard IDs are rejected"""
     request = ScheduleRequest(
         employees=[
@@ -1242,13 +1197,12 @@ def test_duplicate_car_yard_ids():
         days=[DayOfWeek.MONDAY]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 400
-    assert "duplicate car yard" in response.json()["detail"].lower()
+    assert "duplicate car yard" in _loads(response)["detail"].lower()
 
 
-def test_min_greater_than_max_employees():
+def test_min_greater_than_max_employees(client):
     """Test that min_employees > max_employees is rejected"""
     request = ScheduleRequest(
         employees=[
@@ -1267,14 +1221,13 @@ def test_min_greater_than_max_employees():
         days=[DayOfWeek.MONDAY]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 400
-    detail = response.json()["detail"].lower()
+    detail = _loads(response)["detail"].lower()
     assert "min_employees" in detail and "max_employees" in detail
 
 
-def test_empty_employees_list():
+def test_empty_employees_list(client):
     """Test that empty employees list is rejected"""
     request = ScheduleRequest(
         employees=[],
@@ -1285,13 +1238,12 @@ def test_empty_employees_list():
         days=[DayOfWeek.MONDAY]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 400
-    assert "at least one employee" in response.json()["detail"].lower()
+    assert "at least one employee" in _loads(response)["detail"].lower()
 
 
-def test_empty_car_yards_list():
+def test_empty_car_yards_list(client):
     """Test that empty car_yards list is rejected"""
     request = ScheduleRequest(
         employees=[
@@ -1306,13 +1258,12 @@ def test_empty_car_yards_list():
         days=[DayOfWeek.MONDAY]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 400
-    assert "at least one car yard" in response.json()["detail"].lower()
+    assert "at least one car yard" in _loads(response)["detail"].lower()
 
 
-def test_empty_days_list():
+def test_empty_days_list(client):
     """Test that empty days list is rejected"""
     request = ScheduleRequest(
         employees=[
@@ -1330,13 +1281,12 @@ def test_empty_days_list():
         days=[]
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 400
-    assert "at least one day" in response.json()["detail"].lower()
+    assert "at least one day" in _loads(response)["detail"].lower()
 
 
-def test_invalid_yard_group_ids():
+def test_invalid_yard_group_ids(client):
     """Test that yard_groups with invalid yard IDs are rejected"""
     request = ScheduleRequest(
         employees=[
@@ -1355,14 +1305,13 @@ def test_invalid_yard_group_ids():
         yard_groups={"group1": [999]}  # Invalid yard ID
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 400
-    detail = response.json()["detail"].lower()
+    detail = _loads(response)["detail"].lower()
     assert "invalid yard" in detail or "yard group" in detail
 
 
-def test_per_week_exceeds_available_days():
+def test_per_week_exceeds_available_days(client):
     """Test that per_week visits > len(days) is rejected"""
     request = ScheduleRequest(
         employees=[
@@ -1381,14 +1330,13 @@ def test_per_week_exceeds_available_days():
         days=[DayOfWeek.MONDAY, DayOfWeek.TUESDAY]  # Only 2 days
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 400
-    detail = response.json()["detail"].lower()
+    detail = _loads(response)["detail"].lower()
     assert "requires" in detail and "visits" in detail and "days" in detail
 
 
-def test_work_distribution_consistency():
+def test_work_distribution_consistency(client):
     """Test that when multiple employees work same yard, their work hours are approximately equal"""
     employees = [
         Employee(
@@ -1432,11 +1380,10 @@ def test_work_distribution_consistency():
         max_hours_per_day=7.0
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
     assert response.status_code == 200
 
-    data = response.json()
+    data = _loads(response)
     hours_stats = data["stats"]["hours_per_employee_day"]
 
     # Get hours for all employees on Monday
@@ -1455,7 +1402,7 @@ def test_work_distribution_consistency():
             f"Work distribution should be approximately equal. Max: {max_hours:.3f}h, Min: {min_hours:.3f}h, Diff: {difference:.3f}h"
 
 
-def test_extra_employee_penalty_only_applies_to_single_yard_work():
+def test_extra_employee_penalty_only_applies_to_single_yard_work(client):
     """
     Test that extra employee penalty only applies when employees work a single yard,
     not when they work multiple yards sequentially.
@@ -1519,10 +1466,9 @@ def test_extra_employee_penalty_only_applies_to_single_yard_work():
         travel_buffer_minutes=30
     )
 
-    response_multi = client.post(
-        "/api/v1/roster", json=request_multi.model_dump(mode="json"))
+    response_multi = _post_roster(client, request_multi)
     assert response_multi.status_code == 200
-    data_multi = response_multi.json()
+    data_multi = _loads(response_multi)
 
     # Verify assignments for multi-yard scenario
     assignments_multi = data_multi["assignments"]
@@ -1548,15 +1494,15 @@ def test_extra_employee_penalty_only_applies_to_single_yard_work():
     employees_working_both = yard_a_employees & yard_b_employees
 
     if DEBUG:
-        print(f"\n{'='*60}")
+        print(f"\n{BAR_60}")
         print("🔍 Multi-Yard Scenario (No Penalty Expected)")
-        print(f"{'='*60}")
+        print(f"{BAR_60}")
         print(f"Yard A employees: {yard_a_employees}")
         print(f"Yard B employees: {yard_b_employees}")
         print(f"Employees working both yards: {employees_working_both}")
         print(f"Yard A employee count: {len(yard_a_employees)}")
         print(f"Yard B employee count: {len(yard_b_employees)}")
-        print(f"{'='*60}\n")
+        print(f"{BAR_60}\n")
 
     # If employees work both yards, no penalty should apply
     # This means the solver can use more employees without penalty
@@ -1592,10 +1538,9 @@ def test_extra_employee_penalty_only_applies_to_single_yard_work():
         max_hours_per_day=7.0
     )
 
-    response_single = client.post(
-        "/api/v1/roster", json=request_single.model_dump(mode="json"))
+    response_single = _post_roster(client, request_single)
     assert response_single.status_code == 200
-    data_single = response_single.json()
+    data_single = _loads(response_single)
 
     # Verify assignments for single-yard scenario
     assignments_single = data_single["assignments"]
@@ -1608,12 +1553,12 @@ def test_extra_employee_penalty_only_applies_to_single_yard_work():
     }
 
     if DEBUG:
-        print(f"\n{'='*60}")
+        print(f"\n{BAR_60}")
         print("🔍 Single-Yard Scenario (Penalty Expected)")
-        print(f"{'='*60}")
+        print(f"{BAR_60}")
         print(f"Yard C employees: {yard_c_employees}")
         print(f"Yard C employee count: {len(yard_c_employees)}")
-        print(f"{'='*60}\n")
+        print(f"{BAR_60}\n")
 
     # Verify yard is covered
     assert len(yard_c_employees) >= 1, "Yard C should have at least min employees"
@@ -1657,7 +1602,7 @@ def test_extra_employee_penalty_only_applies_to_single_yard_work():
         print(f"   Single-yard scenario: Penalty applies when employees work only one yard")
 
 
-def test_per_week_with_required_days():
+def test_per_week_with_required_days(client):
     """
     Test the combination of per_week and required_days constraints.
 
@@ -1734,23 +1679,22 @@ def test_per_week_with_required_days():
         max_hours_per_day=7.0
     )
 
-    response = client.post(
-        "/api/v1/roster", json=request.model_dump(mode="json"))
+    response = _post_roster(client, request)
 
     if DEBUG:
-        print(f"\n{'='*60}")
+        print(f"\n{BAR_60}")
         print("🔍 Per-Week with Required Days Test")
-        print(f"{'='*60}")
+        print(f"{BAR_60}")
         print(f"Yard: {car_yards[0].name}")
         print(f"per_week: {car_yards[0].per_week}")
         print(f"required_days: {car_yards[0].required_days}")
-        print(f"{'='*60}\n")
+        print(f"{BAR_60}\n")
 
     # Verify the request was successful
     assert response.status_code == 200, \
-        f"Request should succeed. Got status {response.status_code}: {response.json().get('detail', 'Unknown error')}"
+        f"Request should succeed. Got status {response.status_code}: {_loads(response).get('detail', 'Unknown error')}"
 
-    data = response.json()
+    data = _loads(response)
     assignments = data["assignments"]
 
     # Group assignments by day
@@ -1823,3 +1767,138 @@ def test_per_week_with_required_days():
     if gap_requirement >= 2:
         assert other_visit_day != DayOfWeek.TUESDAY, \
             f"The other visit cannot be on Tuesday if gap_requirement >= 2 (gap from Monday would be 1 day)"
+
+
+def test_repeated_request_served_from_cache(client):
+    """Identical requests reuse the cached response instead of re-solving"""
+    request = _single_yard_request()
+
+    first = _post_roster(client, request)
+    hits_before = _solve_roster_cached.cache_info().hits
+    second = _post_roster(client, request)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert _solve_roster_cached.cache_info().hits == hits_before + 1
+    assert _loads(second) == _loads(first)
+
+
+def test_model_reused_across_solver_settings():
+    """Requests differing only in solver settings reuse the built model"""
+    request = _single_yard_request()
+
+    first = solve_roster(request)
+    hits_before = _build_roster_model_cached.cache_info().hits
+    second = solve_roster(request.model_copy(update={"num_search_workers": 2}))
+
+    assert _build_roster_model_cached.cache_info().hits == hits_before + 1
+    assert first.assignments == second.assignments
+
+
+def test_unstaffable_required_visits_rejected_before_solving(client):
+    """Mandatory visits that can never get a minimum crew fail fast with a clear error"""
+    request = ScheduleRequest(
+        employees=[
+            Employee(
+                id=1,
+                name="Only One",
+                ranking=EmployeeReliabilityRating.EXCELLENT,
+                available_days=[DayOfWeek.MONDAY, DayOfWeek.TUESDAY]
+            )
+        ],
+        car_yards=[
+            CarYard(id=1, name="Crew Yard", priority=CarYardPriority.HIGH,
+                    min_employees=2, max_employees=2, region=CarYardRegion.CENTRAL,
+                    required_days=[DayOfWeek.MONDAY])
+        ],
+        days=[DayOfWeek.MONDAY, DayOfWeek.TUESDAY]
+    )
+
+    response = _post_roster(client, request)
+    assert response.status_code == 400
+    assert "requires 1 visit(s)" in _loads(response)["detail"]
+
+
+@pytest.mark.parametrize("settings", [
+    pytest.param({"num_search_workers": 1}, id="num_search_workers"),
+    # More workers than the cap are clamped rather than rejected
+    pytest.param({"num_search_workers": 512}, id="num_search_workers_over_cap"),
+    pytest.param({"linearization_level": 0, "optimize_with_core": True,
+                  "cp_model_presolve": False}, id="tuning_fields"),
+    pytest.param({"time_limit_seconds": MAX_SOLVER_TIMEOUT_SECONDS}, id="time_limit_at_cap"),
+    pytest.param({"solver_params": {"symmetry_level": 1, "random_seed": 7}},
+                 id="solver_params"),
+])
+def test_solver_settings_accepted(client, settings):
+    """Solver settings are applied without changing the result"""
+    response = _post_roster(client, _single_yard_request(**settings))
+    assert response.status_code == 200
+    assert len(_loads(response)["assignments"]) == 1
+
+
+@pytest.mark.parametrize("settings,status_code,detail", [
+    ({"num_search_workers": 0}, 422, None),
+    ({"linearization_level": 3}, 422, None),
+    ({"time_limit_seconds": 0}, 422, None),
+    ({"time_limit_seconds": MAX_SOLVER_TIMEOUT_SECONDS + 1}, 422, None),
+    ({"solver_params": {"not_a_parameter": 1}}, 400, "not_a_parameter"),
+    # Time budget, worker count and logging stay under the service's control
+    ({"solver_params": {"max_time_in_seconds": 1e6}}, 400, "max_time_in_seconds"),
+    ({"solver_params": {"num_workers": 512}}, 400, "num_workers"),
+    ({"solver_params": {"num_search_workers": 512}}, 400, "num_search_workers"),
+    ({"solver_params": {"log_search_progress": True}}, 400, "log_search_progress"),
+    # Dedicated fields can't be bypassed, and values are range-checked
+    ({"solver_params": {"linearization_level": -7}}, 400, "linearization_level"),
+    ({"solver_params": {"symmetry_level": -5}}, 400, "symmetry_level"),
+    ({"solver_params": {"random_seed": "7"}}, 400, "random_seed"),
+    ({"solver_params": {"use_lns_only": 5}}, 400, "use_lns_only"),
+])
+def test_solver_settings_rejected(client, settings, status_code, detail):
+    """Invalid or service-controlled solver settings are rejected before solving"""
+    payload = {**_single_yard_request().model_dump(mode="json"), **settings}
+    response = client.post("/api/v1/roster", json=payload)
+    assert response.status_code == status_code
+    if detail is not None:
+        assert detail in _loads(response)["detail"]
+
+
+def test_preview_returns_feasible_roster(client, sample_request, sample_car_yards):
+    """Preview requests return the first valid roster without the optimisation stage"""
+    request = sample_request.model_copy(update={"preview": True})
+
+    response = _post_roster(client, request)
+    assert response.status_code == 200
+
+    data = _loads(response)
+    # The secondary objectives are never optimised, so a preview is only feasible
+    assert data["status"] == "feasible"
+    assert len(data["assignments"]) > 0
+
+    counts = Counter((assignment["day"], assignment["car_yard_id"])
+                     for assignment in data["assignments"])
+    yards = {cy.id: cy for cy in sample_car_yards}
+    for (_, cy_id), count in counts.items():
+        assert yards[cy_id].min_employees <= count <= yards[cy_id].max_employees
+
+
+def test_preview_without_required_days_covers_yards():
+    """A preview never settles for the empty roster when yards can be covered"""
+    days = [DayOfWeek.MONDAY, DayOfWeek.TUESDAY]
+    request = ScheduleRequest(
+        employees=[
+            Employee(id=1, name="Excellent", ranking=EmployeeReliabilityRating.EXCELLENT,
+                     available_days=days),
+            Employee(id=2, name="Acceptable", ranking=EmployeeReliabilityRating.ACCEPTABLE,
+                     available_days=days)
+        ],
+        car_yards=[
+            CarYard(id=1, name="Yard A", priority=CarYardPriority.HIGH, min_employees=1,
+                    max_employees=2, hours_required=4.0, region=CarYardRegion.CENTRAL)
+        ],
+        days=days,
+        preview=True
+    )
+
+    data = _solve(request)
+    assert data["status"] == "feasible"
+    assert len(data["assignments"]) > 0